@@ -8,6 +8,7 @@ import os
 import sys
 import yaml
 import json
+import logging
 import time
 import click
 import importlib.util
@@ -132,15 +133,16 @@ class TestDiscovery:
 class TestExecutor:
     """Execute individual test cases"""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], max_workers: int = 1):
         self.config = config
+        self.max_workers = max_workers
         self.s3_client = None
         self._setup_s3_client()
 
     def _setup_s3_client(self):
         """Setup S3 client from configuration"""
         # Import common module for S3 client setup
-        from common.s3_client import S3Client
+        from common.s3_client import S3Client, DEFAULT_CLIENT_CONFIG
 
         self.s3_client = S3Client(
             endpoint_url=self.config.get("s3_endpoint_url", "http://localhost:9000"),
@@ -149,6 +151,11 @@ class TestExecutor:
             region=self.config.get("s3_region", "us-east-1"),
             use_ssl=self.config.get("s3_use_ssl", False),
             verify_ssl=self.config.get("s3_verify_ssl", True),
+            # Every parallel worker shares this client, so make sure each
+            # one can hold a pooled connection
+            max_pool_connections=max(
+                DEFAULT_CLIENT_CONFIG.max_pool_connections, self.max_workers
+            ),
         )
 
     def execute_test(self, test_info: Dict) -> TestResult:
@@ -392,6 +399,12 @@ class ResultFormatter:
 def main(config, test, group, output_dir, output_format, verbose, list_tests):
     """MSST-S3 Test Runner - Execute S3 interoperability tests"""
 
+    # Tests report progress through logging; only show it when verbose
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(name)s: %(message)s",
+    )
+
     # Load configuration
     config_path = Path(config)
     if config_path.exists():
@@ -482,7 +495,7 @@ def main(config, test, group, output_dir, output_format, verbose, list_tests):
         click.echo(f"Running {len(tests_to_run)} tests...")
 
     # Execute tests
-    executor = TestExecutor(test_config)
+    executor = TestExecutor(test_config, parallel_jobs if run_mode == "parallel" else 1)
     results = []
 
     if run_mode == "parallel" and parallel_jobs > 1:
@@ -5,13 +5,13 @@ Test 1802: Access Point 1802
 Tests S3 Access Point configuration 1802
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1802(s3_client, config):
     """Access Point 1802"""
     fixture = TestFixture(s3_client, config)
@@ -54,32 +54,28 @@ def test_1802(s3_client, config):
             # Simulate access through access point
             # In real scenario, would use access point ARN
             key = f'access-point/test-1802.txt'
-            s3_client.put_object(bucket_name, key, io.BytesIO(b'Access point test'))
+            s3_client.put_object(bucket_name, key, b'Access point test')
 
-            print(f"Access point scenario 1802 tested")
+            logger.info(f"Access point scenario 1802 tested")
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'NotImplemented':
-                print("S3 Access Points not supported")
+                logger.info("S3 Access Points not supported")
             else:
                 raise
 
-        print(f"\nTest 1802 - Access Point 1802: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1802 - Feature not supported: {error_code}")
+            logger.info(f"Test 1802 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1802: {error_code}")
+            logger.info(f"Error in test 1802: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
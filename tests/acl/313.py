@@ -5,12 +5,12 @@ Test 313: ACL bucket-owner-full-control
 Tests ACL setting: bucket-owner-full-control
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_313(s3_client, config):
     """ACL bucket-owner-full-control"""
     fixture = TestFixture(s3_client, config)
@@ -27,28 +27,20 @@ def test_313(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(b'ACL test content'),
+                Body=b'ACL test content',
                 ACL='bucket-owner-full-control'
             )
 
             # Get ACL
             response = s3_client.client.get_object_acl(Bucket=bucket_name, Key=key)
-            print(f"ACL 'bucket-owner-full-control' set: ✓")
+            logger.info(f"ACL 'bucket-owner-full-control' set: ✓")
         except ClientError as e:
-            print(f"ACL 'bucket-owner-full-control' not supported: {e.response['Error']['Code']}")
-
-        print(f"\nTest 313 - ACL bucket-owner-full-control: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 313: {e.response['Error']['Code']}")
-        raise
+            logger.info(f"ACL 'bucket-owner-full-control' not supported: {e.response['Error']['Code']}")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,13 +5,13 @@ Test 1593: Analytics/Inventory 1593
 Tests storage analytics and inventory configuration
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1593(s3_client, config):
     """Analytics/Inventory 1593"""
     fixture = TestFixture(s3_client, config)
@@ -50,7 +50,7 @@ def test_1593(s3_client, config):
                     Id=f'AnalyticsConfig1593',
                     AnalyticsConfiguration=analytics_config
                 )
-                print(f"Analytics configuration 1593 created")
+                logger.info(f"Analytics configuration 1593 created")
             else:
                 # Inventory configuration
                 inventory_config = {
@@ -75,30 +75,26 @@ def test_1593(s3_client, config):
                     Id=f'InventoryConfig1593',
                     InventoryConfiguration=inventory_config
                 )
-                print(f"Inventory configuration 1593 created")
+                logger.info(f"Inventory configuration 1593 created")
 
         except ClientError as e:
             if e.response['Error']['Code'] in ['NotImplemented', 'InvalidRequest']:
-                print(f"Analytics/Inventory feature not supported")
+                logger.info(f"Analytics/Inventory feature not supported")
             else:
                 raise
 
-        print(f"\nTest 1593 - Analytics/Inventory 1593: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1593 - Feature not supported: {error_code}")
+            logger.info(f"Test 1593 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1593: {error_code}")
+            logger.info(f"Error in test 1593: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
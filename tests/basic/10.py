@@ -6,13 +6,14 @@ Tests S3 bucket lifecycle configuration including expiration rules,
 transitions between storage classes, and noncurrent version management.
 """
 
-import io
 import json
-import time
+import logging
 from datetime import datetime, timedelta
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_10(s3_client, config):
     """Object lifecycle rules test"""
     fixture = TestFixture(s3_client, config)
@@ -51,12 +52,12 @@ def test_10(s3_client, config):
             assert len(rules) == 1, f"Expected 1 rule, got {len(rules)}"
             assert rules[0]['ID'] == 'expire-old-logs', "Rule ID mismatch"
             assert rules[0]['Status'] == 'Enabled', "Rule not enabled"
-            print("Basic expiration rule: ✓")
+            logger.info("Basic expiration rule: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Lifecycle rules not supported by this S3 implementation")
+                logger.info("Note: Lifecycle rules not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -107,7 +108,7 @@ def test_10(s3_client, config):
         assert 'expire-temp-files' in rule_ids, "Temp files rule missing"
         assert 'expire-old-data' in rule_ids, "Expire old data rule missing"
         assert 'expire-archived' in rule_ids, "Archive expiration rule missing"
-        print("Multiple lifecycle rules: ✓")
+        logger.info("Multiple lifecycle rules: ✓")
 
         # Test 3: Tag-based lifecycle rules (simpler version)
         tag_based_lifecycle = {
@@ -149,14 +150,14 @@ def test_10(s3_client, config):
 
             if tag_rule:
                 assert 'Filter' in tag_rule, "Filter missing in tag rule"
-                print("Tag-based lifecycle rules: ✓")
+                logger.info("Tag-based lifecycle rules: ✓")
             else:
-                print("Note: Tag-based rules may not be fully supported")
+                logger.info("Note: Tag-based rules may not be fully supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest', 'InvalidStorageClass', 'InvalidArgument']:
-                print("Note: Tag-based lifecycle rules not supported")
+                logger.info("Note: Tag-based lifecycle rules not supported")
             else:
                 raise
 
@@ -186,12 +187,12 @@ def test_10(s3_client, config):
                 LifecycleConfiguration=noncurrent_lifecycle
             )
 
-            print("Noncurrent version lifecycle rules: ✓")
+            logger.info("Noncurrent version lifecycle rules: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest']:
-                print("Note: Noncurrent version rules not supported")
+                logger.info("Note: Noncurrent version rules not supported")
             else:
                 raise
 
@@ -226,13 +227,13 @@ def test_10(s3_client, config):
                 if rule['ID'] == 'expire-on-date':
                     assert 'Expiration' in rule, "Expiration missing"
                     assert 'Date' in rule['Expiration'], "Date missing in expiration"
-                    print("Date-based expiration: ✓")
+                    logger.info("Date-based expiration: ✓")
                     break
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Date-based expiration not supported")
+                logger.info("Note: Date-based expiration not supported")
             else:
                 raise
 
@@ -280,7 +281,7 @@ def test_10(s3_client, config):
                 enabled_found = True
 
         assert disabled_found and enabled_found, "Both rules should be present"
-        print("Rule enable/disable: ✓")
+        logger.info("Rule enable/disable: ✓")
 
         # Test 7: Delete lifecycle configuration
         s3_client.client.delete_bucket_lifecycle(Bucket=bucket_name)
@@ -297,7 +298,7 @@ def test_10(s3_client, config):
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NoSuchLifecycleConfiguration':
-                print("Lifecycle deletion: ✓")
+                logger.info("Lifecycle deletion: ✓")
             else:
                 raise
 
@@ -332,7 +333,7 @@ def test_10(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 key,
-                io.BytesIO(b'Test content')
+                b'Test content'
             )
 
         # List objects that would be affected
@@ -340,24 +341,24 @@ def test_10(s3_client, config):
         affected_count = len(objects)
         assert affected_count >= 2, f"Expected at least 2 affected objects, got {affected_count}"
 
-        print(f"\nLifecycle rules test completed:")
-        print(f"- Basic expiration: ✓")
-        print(f"- Multiple rules: ✓")
-        print(f"- Filter types: ✓")
-        print(f"- Rule management: ✓")
-        print(f"- Objects would be affected: {affected_count}")
+        logger.info(f"Lifecycle rules test completed:")
+        logger.info(f"- Basic expiration: ✓")
+        logger.info(f"- Multiple rules: ✓")
+        logger.info(f"- Filter types: ✓")
+        logger.info(f"- Rule management: ✓")
+        logger.info(f"- Objects would be affected: {affected_count}")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Lifecycle rules are not implemented in this S3 provider")
+            logger.info("Lifecycle rules are not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Try to delete lifecycle configuration
                 try:
@@ -366,9 +367,7 @@ def test_10(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
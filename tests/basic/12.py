@@ -123,15 +123,10 @@ def test_12(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Delete all test objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    try:
-                        s3_client.delete_object(bucket_name, obj['Key'])
-                    except:
-                        pass
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
@@ -6,12 +6,13 @@ Tests system behavior and recovery mechanisms when operations partially fail.
 Validates that partial failures are handled gracefully and can be recovered.
 """
 
-import io
-import time
+import logging
 import threading
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_13(s3_client, config):
     """Partial failure recovery test"""
     fixture = TestFixture(s3_client, config)
@@ -45,7 +46,7 @@ def test_13(s3_client, config):
                 object_key,
                 upload_id,
                 part_num,
-                io.BytesIO(parts_data[part_num - 1])
+                parts_data[part_num - 1]
             )
             uploaded_parts.append({
                 'PartNumber': part_num,
@@ -87,7 +88,7 @@ def test_13(s3_client, config):
                     object_key,
                     upload_id,
                     part_num,
-                    io.BytesIO(parts_data[part_num - 1])
+                    parts_data[part_num - 1]
                 )
                 uploaded_parts.append({
                     'PartNumber': part_num,
@@ -106,7 +107,7 @@ def test_13(s3_client, config):
                     object_key,
                     upload_id,
                     part_num,
-                    io.BytesIO(parts_data[part_num - 1])
+                    parts_data[part_num - 1]
                 )
                 uploaded_parts.append({
                     'PartNumber': part_num,
@@ -154,7 +155,7 @@ def test_13(s3_client, config):
                 s3_client.put_object(
                     bucket_name,
                     op['key'],
-                    io.BytesIO(op['data'])
+                    op['data']
                 )
                 success_count += 1
                 if op['valid']:
@@ -195,7 +196,7 @@ def test_13(s3_client, config):
                     s3_client.put_object(
                         bucket_name,
                         key,
-                        io.BytesIO(data),
+                        data,
                         Metadata={'invalid\x00key': 'value'}  # Invalid metadata key
                     )
                 else:
@@ -203,7 +204,7 @@ def test_13(s3_client, config):
                     s3_client.put_object(
                         bucket_name,
                         key,
-                        io.BytesIO(data)
+                        data
                     )
 
                 with lock:
@@ -247,7 +248,7 @@ def test_13(s3_client, config):
                 key,
                 upload_id,
                 1,
-                io.BytesIO(b'Incomplete data')
+                b'Incomplete data'
             )
 
         # List incomplete uploads
@@ -277,11 +278,11 @@ def test_13(s3_client, config):
                 assert remaining['UploadId'] != upload['UploadId'], \
                     f"Upload {upload['UploadId']} not cleaned up"
 
-        print(f"Partial failure recovery test completed:")
-        print(f"- Multipart recovery: ✓")
-        print(f"- Batch operations: {success_count} succeeded")
-        print(f"- Concurrent operations: {concurrent_results['success']}/{num_operations} succeeded")
-        print(f"- Incomplete upload cleanup: {len(incomplete_uploads)} cleaned")
+        logger.info(f"Partial failure recovery test completed:")
+        logger.info(f"- Multipart recovery: ✓")
+        logger.info(f"- Batch operations: {success_count} succeeded")
+        logger.info(f"- Concurrent operations: {concurrent_results['success']}/{num_operations} succeeded")
+        logger.info(f"- Incomplete upload cleanup: {len(incomplete_uploads)} cleaned")
 
     finally:
         # Cleanup any remaining multipart uploads
@@ -292,11 +293,9 @@ def test_13(s3_client, config):
                 pass
 
         # Cleanup bucket
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
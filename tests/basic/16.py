@@ -6,11 +6,13 @@ Tests S3 bucket notification configuration for various event types
 including SNS, SQS, and Lambda function notifications.
 """
 
-import io
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_16(s3_client, config):
     """Bucket notifications test"""
     fixture = TestFixture(s3_client, config)
@@ -34,12 +36,12 @@ def test_16(s3_client, config):
                 "Should have no queue configurations initially"
             assert 'LambdaFunctionConfigurations' not in response or len(response.get('LambdaFunctionConfigurations', [])) == 0, \
                 "Should have no lambda configurations initially"
-            print("Empty notification configuration: ✓")
+            logger.info("Empty notification configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Bucket notifications not supported by this S3 implementation")
+                logger.info("Note: Bucket notifications not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -88,14 +90,14 @@ def test_16(s3_client, config):
                 config = topic_configs[0]
                 assert config.get('Id') == 'ObjectCreatedNotification', "Topic config ID mismatch"
                 assert 's3:ObjectCreated:*' in config.get('Events', []), "ObjectCreated event not found"
-                print("SNS topic notification: ✓")
+                logger.info("SNS topic notification: ✓")
             else:
-                print("Note: SNS notifications may not be supported")
+                logger.info("Note: SNS notifications may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification', 'NotImplemented']:
-                print("Note: SNS notifications not supported")
+                logger.info("Note: SNS notifications not supported")
             else:
                 raise
 
@@ -139,14 +141,14 @@ def test_16(s3_client, config):
                 config = queue_configs[0]
                 assert config.get('Id') == 'ObjectRemovedNotification', "Queue config ID mismatch"
                 assert 's3:ObjectRemoved:*' in config.get('Events', []), "ObjectRemoved event not found"
-                print("SQS queue notification: ✓")
+                logger.info("SQS queue notification: ✓")
             else:
-                print("Note: SQS notifications may not be supported")
+                logger.info("Note: SQS notifications may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification', 'NotImplemented']:
-                print("Note: SQS notifications not supported")
+                logger.info("Note: SQS notifications not supported")
             else:
                 raise
 
@@ -195,14 +197,14 @@ def test_16(s3_client, config):
                 config = lambda_configs[0]
                 assert config.get('Id') == 'ProcessUploadedImages', "Lambda config ID mismatch"
                 assert 's3:ObjectCreated:Put' in config.get('Events', []), "Put event not found"
-                print("Lambda function notification: ✓")
+                logger.info("Lambda function notification: ✓")
             else:
-                print("Note: Lambda notifications may not be supported")
+                logger.info("Note: Lambda notifications may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification', 'NotImplemented']:
-                print("Note: Lambda notifications not supported")
+                logger.info("Note: Lambda notifications not supported")
             else:
                 raise
 
@@ -249,14 +251,14 @@ def test_16(s3_client, config):
             )
 
             if total_configs > 0:
-                print(f"Multiple notifications configured: {total_configs} total")
+                logger.info(f"Multiple notifications configured: {total_configs} total")
             else:
-                print("Note: Multiple notification types may not be supported")
+                logger.info("Note: Multiple notification types may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification', 'NotImplemented']:
-                print("Note: Multiple notification types not supported")
+                logger.info("Note: Multiple notification types not supported")
             else:
                 raise
 
@@ -293,14 +295,14 @@ def test_16(s3_client, config):
             if topic_configs and len(topic_configs) > 0:
                 events = topic_configs[0].get('Events', [])
                 assert len(events) > 0, "No events configured"
-                print(f"Event type variations: {len(events)} event types configured")
+                logger.info(f"Event type variations: {len(events)} event types configured")
             else:
-                print("Note: Various event types may not be supported")
+                logger.info("Note: Various event types may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification']:
-                print("Note: Some event types may not be supported")
+                logger.info("Note: Some event types may not be supported")
             else:
                 raise
 
@@ -325,11 +327,11 @@ def test_16(s3_client, config):
             )
 
             assert total_configs == 0, "Notifications should be cleared"
-            print("Clear notifications: ✓")
+            logger.info("Clear notifications: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error clearing notifications: {error_code}")
+            logger.info(f"Note: Error clearing notifications: {error_code}")
 
         # Test 8: Invalid ARN format (should fail)
         invalid_notification = {
@@ -348,13 +350,13 @@ def test_16(s3_client, config):
                 NotificationConfiguration=invalid_notification
             )
             # Some implementations might not validate ARN format
-            print("Note: Invalid ARN format accepted by this implementation")
+            logger.info("Note: Invalid ARN format accepted by this implementation")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             assert error_code in ['InvalidArgument', 'MalformedXML', 'InvalidNotificationConfiguration', 'UnsupportedNotification'], \
                 f"Unexpected error for invalid ARN: {error_code}"
-            print("Invalid ARN rejection: ✓")
+            logger.info("Invalid ARN rejection: ✓")
 
         # Test 9: Notification with complex filters
         complex_filter_notification = {
@@ -391,34 +393,34 @@ def test_16(s3_client, config):
                 filter_rules = topic_configs[0].get('Filter', {}).get('Key', {}).get('FilterRules', [])
                 if filter_rules:
                     assert len(filter_rules) == 2, "Should have prefix and suffix rules"
-                    print("Complex filter notifications: ✓")
+                    logger.info("Complex filter notifications: ✓")
                 else:
-                    print("Note: Complex filters may not be fully supported")
+                    logger.info("Note: Complex filters may not be fully supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidArgument', 'UnsupportedNotification']:
-                print("Note: Complex filters not supported")
+                logger.info("Note: Complex filters not supported")
             else:
                 raise
 
-        print(f"\nBucket notifications test completed:")
-        print(f"- Basic notifications: ✓")
-        print(f"- Various notification types tested")
-        print(f"- Filter configurations tested")
-        print(f"- Notification management: ✓")
+        logger.info(f"Bucket notifications test completed:")
+        logger.info(f"- Basic notifications: ✓")
+        logger.info(f"- Various notification types tested")
+        logger.info(f"- Filter configurations tested")
+        logger.info(f"- Notification management: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Bucket notifications are not implemented in this S3 provider")
+            logger.info("Bucket notifications are not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Try to clear notifications first
                 try:
@@ -430,9 +432,7 @@ def test_16(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
@@ -6,12 +6,14 @@ Tests S3 server-side encryption functionality including SSE-S3,
 SSE-KMS, and SSE-C encryption methods.
 """
 
-import io
 import base64
 import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_17(s3_client, config):
     """Server-side encryption test"""
     fixture = TestFixture(s3_client, config)
@@ -31,7 +33,7 @@ def test_17(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_sse_s3,
-                Body=io.BytesIO(test_data),
+                Body=test_data,
                 ServerSideEncryption='AES256'
             )
 
@@ -50,12 +52,12 @@ def test_17(s3_client, config):
             downloaded_data = response['Body'].read()
             assert downloaded_data == test_data, "Data corrupted after SSE-S3 encryption"
 
-            print("SSE-S3 encryption (AES256): ✓")
+            logger.info("SSE-S3 encryption (AES256): ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Server-side encryption not supported by this S3 implementation")
+                logger.info("Note: Server-side encryption not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -69,7 +71,7 @@ def test_17(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_sse_kms,
-                Body=io.BytesIO(test_data_kms),
+                Body=test_data_kms,
                 ServerSideEncryption='aws:kms'
             )
 
@@ -83,14 +85,14 @@ def test_17(s3_client, config):
                 assert response.get('ServerSideEncryption') == 'aws:kms', \
                     "Object not encrypted with KMS"
 
-                print("SSE-KMS encryption: ✓")
+                logger.info("SSE-KMS encryption: ✓")
             else:
-                print("Note: SSE-KMS may not be fully supported")
+                logger.info("Note: SSE-KMS may not be fully supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'KMS.NotFoundException', 'NotImplemented', 'InvalidEncryptionMethod']:
-                print("Note: SSE-KMS not supported or KMS not configured")
+                logger.info("Note: SSE-KMS not supported or KMS not configured")
             else:
                 raise
 
@@ -109,7 +111,7 @@ def test_17(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_sse_c,
-                Body=io.BytesIO(test_data_sse_c),
+                Body=test_data_sse_c,
                 SSECustomerAlgorithm='AES256',
                 SSECustomerKey=customer_key,
                 SSECustomerKeyMD5=customer_key_md5
@@ -124,7 +126,7 @@ def test_17(s3_client, config):
             try:
                 response = s3_client.get_object(bucket_name, object_key_sse_c)
                 # If we get here, SSE-C is not properly enforced
-                print("Note: SSE-C object accessible without key")
+                logger.info("Note: SSE-C object accessible without key")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 assert error_code in ['InvalidRequest', 'AccessDenied', 'MissingSecurityHeader'], \
@@ -142,12 +144,12 @@ def test_17(s3_client, config):
             assert downloaded_data == test_data_sse_c, \
                 "Data corrupted after SSE-C encryption"
 
-            print("SSE-C encryption: ✓")
+            logger.info("SSE-C encryption: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented', 'InvalidArgument']:
-                print("Note: SSE-C not supported")
+                logger.info("Note: SSE-C not supported")
             else:
                 raise
 
@@ -183,7 +185,7 @@ def test_17(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 default_encrypted_key,
-                io.BytesIO(b'This should be encrypted by default')
+                b'This should be encrypted by default'
             )
 
             # Verify object is encrypted
@@ -191,12 +193,12 @@ def test_17(s3_client, config):
             assert response.get('ServerSideEncryption') == 'AES256', \
                 "Object not encrypted with default encryption"
 
-            print("Bucket default encryption: ✓")
+            logger.info("Bucket default encryption: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest']:
-                print("Note: Bucket default encryption not supported")
+                logger.info("Note: Bucket default encryption not supported")
             else:
                 raise
 
@@ -218,11 +220,11 @@ def test_17(s3_client, config):
             assert response.get('ServerSideEncryption') == 'AES256', \
                 "Copied object not encrypted"
 
-            print("Copy encrypted object: ✓")
+            logger.info("Copy encrypted object: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error copying encrypted object: {error_code}")
+            logger.info(f"Note: Error copying encrypted object: {error_code}")
 
         # Test 6: Multipart upload with encryption
         multipart_key = 'multipart-encrypted.bin'
@@ -244,7 +246,7 @@ def test_17(s3_client, config):
                 multipart_key,
                 upload_id,
                 1,
-                io.BytesIO(part_data)
+                part_data
             )
 
             # Complete multipart upload
@@ -261,11 +263,11 @@ def test_17(s3_client, config):
             assert response.get('ServerSideEncryption') == 'AES256', \
                 "Multipart upload not encrypted"
 
-            print("Multipart upload with encryption: ✓")
+            logger.info("Multipart upload with encryption: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error with encrypted multipart upload: {error_code}")
+            logger.info(f"Note: Error with encrypted multipart upload: {error_code}")
             # Try to abort if it failed
             try:
                 s3_client.abort_multipart_upload(bucket_name, multipart_key, upload_id)
@@ -280,20 +282,20 @@ def test_17(s3_client, config):
             try:
                 response = s3_client.client.get_bucket_encryption(Bucket=bucket_name)
                 # If we get here, encryption still exists
-                print("Note: Bucket encryption not fully removed")
+                logger.info("Note: Bucket encryption not fully removed")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'ServerSideEncryptionConfigurationNotFoundError':
-                    print("Delete bucket encryption: ✓")
+                    logger.info("Delete bucket encryption: ✓")
                 else:
-                    print(f"Note: Unexpected error checking encryption: {error_code}")
+                    logger.info(f"Note: Unexpected error checking encryption: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Delete bucket encryption not supported")
+                logger.info("Note: Delete bucket encryption not supported")
             else:
-                print(f"Note: Error deleting bucket encryption: {error_code}")
+                logger.info(f"Note: Error deleting bucket encryption: {error_code}")
 
         # Test 8: Encryption with metadata
         metadata_key = 'encrypted-with-metadata.txt'
@@ -301,7 +303,7 @@ def test_17(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=metadata_key,
-                Body=io.BytesIO(b'Encrypted with metadata'),
+                Body=b'Encrypted with metadata',
                 ServerSideEncryption='AES256',
                 Metadata={
                     'encryption-test': 'true',
@@ -318,28 +320,28 @@ def test_17(s3_client, config):
             assert metadata.get('encryption-test') == 'true', \
                 "Metadata not preserved with encryption"
 
-            print("Encryption with metadata: ✓")
+            logger.info("Encryption with metadata: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error with encrypted metadata object: {error_code}")
+            logger.info(f"Note: Error with encrypted metadata object: {error_code}")
 
-        print(f"\nServer-side encryption test completed:")
-        print(f"- SSE-S3 (AES256): ✓")
-        print(f"- Various encryption methods tested")
-        print(f"- Encryption management: ✓")
+        logger.info(f"Server-side encryption test completed:")
+        logger.info(f"- SSE-S3 (AES256): ✓")
+        logger.info(f"- Various encryption methods tested")
+        logger.info(f"- Encryption management: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Server-side encryption is not implemented in this S3 provider")
+            logger.info("Server-side encryption is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Try to delete bucket encryption first
                 try:
@@ -348,9 +350,7 @@ def test_17(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
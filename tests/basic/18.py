@@ -6,11 +6,13 @@ Tests S3 Object Lock functionality including retention modes,
 legal holds, and governance/compliance modes.
 """
 
-import io
+import logging
 from datetime import datetime, timedelta
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_18(s3_client, config):
     """Object locking test"""
     fixture = TestFixture(s3_client, config)
@@ -47,12 +49,12 @@ def test_18(s3_client, config):
                     ObjectLockConfiguration=object_lock_config
                 )
 
-                print("Object lock configuration set: ✓")
+                logger.info("Object lock configuration set: ✓")
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code in ['NotImplemented', 'InvalidBucketState', 'InvalidRequest']:
-                    print("Note: Object Lock not supported or cannot be enabled on existing bucket")
+                    logger.info("Note: Object Lock not supported or cannot be enabled on existing bucket")
                     return
                 else:
                     raise
@@ -63,14 +65,14 @@ def test_18(s3_client, config):
             config_status = response.get('ObjectLockConfiguration', {})
 
             if config_status.get('ObjectLockEnabled') == 'Enabled':
-                print("Object lock enabled: ✓")
+                logger.info("Object lock enabled: ✓")
             else:
-                print("Note: Object lock may not be fully enabled")
+                logger.info("Note: Object lock may not be fully enabled")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['ObjectLockConfigurationNotFoundError', 'NotImplemented']:
-                print("Note: Object lock not configured")
+                logger.info("Note: Object lock not configured")
                 return
             else:
                 raise
@@ -84,7 +86,7 @@ def test_18(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_retention,
-                Body=io.BytesIO(test_data),
+                Body=test_data,
                 ObjectLockMode='GOVERNANCE',
                 ObjectLockRetainUntilDate=retention_until.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
             )
@@ -102,17 +104,17 @@ def test_18(s3_client, config):
             # Try to delete (should fail)
             try:
                 s3_client.delete_object(bucket_name, object_key_retention)
-                print("Warning: Object with retention was deleted (shouldn't happen)")
+                logger.info("Warning: Object with retention was deleted (shouldn't happen)")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 assert error_code in ['AccessDenied', 'ObjectLocked'], \
                     f"Unexpected error deleting locked object: {error_code}"
-                print("Object retention protection: ✓")
+                logger.info("Object retention protection: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented', 'InvalidArgument']:
-                print("Note: Object retention not supported")
+                logger.info("Note: Object retention not supported")
             else:
                 raise
 
@@ -125,7 +127,7 @@ def test_18(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 object_key_legal,
-                io.BytesIO(test_data_legal)
+                test_data_legal
             )
 
             # Apply legal hold
@@ -149,12 +151,12 @@ def test_18(s3_client, config):
             # Try to delete (should fail)
             try:
                 s3_client.delete_object(bucket_name, object_key_legal)
-                print("Warning: Object with legal hold was deleted")
+                logger.info("Warning: Object with legal hold was deleted")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 assert error_code in ['AccessDenied', 'ObjectLocked'], \
                     f"Unexpected error deleting legal hold object: {error_code}"
-                print("Legal hold protection: ✓")
+                logger.info("Legal hold protection: ✓")
 
             # Remove legal hold
             s3_client.client.put_object_legal_hold(
@@ -168,7 +170,7 @@ def test_18(s3_client, config):
             # Now deletion should work (if no retention)
             try:
                 s3_client.delete_object(bucket_name, object_key_legal)
-                print("Legal hold removal: ✓")
+                logger.info("Legal hold removal: ✓")
             except ClientError:
                 # Might still have retention
                 pass
@@ -176,7 +178,7 @@ def test_18(s3_client, config):
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented', 'MethodNotAllowed']:
-                print("Note: Legal hold not supported")
+                logger.info("Note: Legal hold not supported")
             else:
                 raise
 
@@ -189,7 +191,7 @@ def test_18(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_compliance,
-                Body=io.BytesIO(test_data_compliance),
+                Body=test_data_compliance,
                 ObjectLockMode='COMPLIANCE',
                 ObjectLockRetainUntilDate=compliance_until.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
             )
@@ -202,7 +204,7 @@ def test_18(s3_client, config):
 
             retention = response.get('Retention', {})
             if retention.get('Mode') == 'COMPLIANCE':
-                print("Compliance mode retention: ✓")
+                logger.info("Compliance mode retention: ✓")
 
                 # Try to override retention (should fail even with governance bypass)
                 try:
@@ -215,15 +217,15 @@ def test_18(s3_client, config):
                             'RetainUntilDate': new_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
                         }
                     )
-                    print("Warning: Compliance retention was modified")
+                    logger.info("Warning: Compliance retention was modified")
                 except ClientError as e:
                     error_code = e.response['Error']['Code']
-                    print("Compliance mode immutability: ✓")
+                    logger.info("Compliance mode immutability: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented']:
-                print("Note: Compliance mode not supported")
+                logger.info("Note: Compliance mode not supported")
             else:
                 raise
 
@@ -250,7 +252,7 @@ def test_18(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 default_locked_key,
-                io.BytesIO(b'Object with default retention')
+                b'Object with default retention'
             )
 
             # Check if default retention was applied
@@ -262,19 +264,19 @@ def test_18(s3_client, config):
 
                 retention = response.get('Retention', {})
                 if retention.get('Mode'):
-                    print("Default bucket retention: ✓")
+                    logger.info("Default bucket retention: ✓")
                 else:
-                    print("Note: Default retention may not be applied")
+                    logger.info("Note: Default retention may not be applied")
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'NoSuchObjectLockConfiguration':
-                    print("Note: Default retention not applied to object")
+                    logger.info("Note: Default retention not applied to object")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented']:
-                print("Note: Default bucket retention not supported")
+                logger.info("Note: Default bucket retention not supported")
             else:
                 raise
 
@@ -287,7 +289,7 @@ def test_18(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key_bypass,
-                Body=io.BytesIO(b'Governance retention object'),
+                Body=b'Governance retention object',
                 ObjectLockMode='GOVERNANCE',
                 ObjectLockRetainUntilDate=bypass_until.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
             )
@@ -299,18 +301,18 @@ def test_18(s3_client, config):
                     Key=object_key_bypass,
                     BypassGovernanceRetention=True
                 )
-                print("Governance bypass: ✓")
+                logger.info("Governance bypass: ✓")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'AccessDenied':
-                    print("Note: Governance bypass requires special permissions")
+                    logger.info("Note: Governance bypass requires special permissions")
                 else:
-                    print(f"Note: Governance bypass failed: {error_code}")
+                    logger.info(f"Note: Governance bypass failed: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented']:
-                print("Note: Governance bypass not supported")
+                logger.info("Note: Governance bypass not supported")
             else:
                 raise
 
@@ -319,7 +321,7 @@ def test_18(s3_client, config):
             # Object lock requires versioning
             versioning_status = s3_client.get_bucket_versioning(bucket_name)
             if versioning_status.get('Status') == 'Enabled':
-                print("Versioning enabled with object lock: ✓")
+                logger.info("Versioning enabled with object lock: ✓")
 
                 # Create multiple versions
                 versioned_key = 'versioned-locked.txt'
@@ -328,7 +330,7 @@ def test_18(s3_client, config):
                 s3_client.put_object(
                     bucket_name,
                     versioned_key,
-                    io.BytesIO(b'Version 1')
+                    b'Version 1'
                 )
 
                 # Version 2 with retention
@@ -336,7 +338,7 @@ def test_18(s3_client, config):
                 response = s3_client.client.put_object(
                     Bucket=bucket_name,
                     Key=versioned_key,
-                    Body=io.BytesIO(b'Version 2'),
+                    Body=b'Version 2',
                     ObjectLockMode='GOVERNANCE',
                     ObjectLockRetainUntilDate=version_until.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
                 )
@@ -351,31 +353,31 @@ def test_18(s3_client, config):
                     )
 
                     if response.get('Retention'):
-                        print("Version-specific retention: ✓")
+                        logger.info("Version-specific retention: ✓")
             else:
-                print("Note: Versioning not enabled with object lock")
+                logger.info("Note: Versioning not enabled with object lock")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error with versioned object lock: {error_code}")
+            logger.info(f"Note: Error with versioned object lock: {error_code}")
 
-        print(f"\nObject locking test completed:")
-        print(f"- Object lock configuration tested")
-        print(f"- Retention modes tested")
-        print(f"- Legal hold tested")
-        print(f"- Protection mechanisms verified")
+        logger.info(f"Object locking test completed:")
+        logger.info(f"- Object lock configuration tested")
+        logger.info(f"- Retention modes tested")
+        logger.info(f"- Legal hold tested")
+        logger.info(f"- Protection mechanisms verified")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Object locking is not implemented in this S3 provider")
+            logger.info("Object locking is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Try to remove all locks first
                 objects = s3_client.list_objects(bucket_name)
@@ -6,13 +6,15 @@ Tests batch operations on multiple objects including bulk copy,
 bulk delete, and batch tagging operations.
 """
 
-import io
+import logging
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_19(s3_client, config):
     """Batch operations test"""
     fixture = TestFixture(s3_client, config)
@@ -30,7 +32,7 @@ def test_19(s3_client, config):
         batch_size = 20
         test_objects = []
 
-        print(f"Batch uploading {batch_size} objects...")
+        logger.info(f"Batch uploading {batch_size} objects...")
         start_time = time.time()
 
         for i in range(batch_size):
@@ -41,18 +43,18 @@ def test_19(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 key,
-                io.BytesIO(data)
+                data
             )
 
         upload_time = time.time() - start_time
-        print(f"Batch upload completed: {batch_size} objects in {upload_time:.2f}s")
+        logger.info(f"Batch upload completed: {batch_size} objects in {upload_time:.2f}s")
 
         # Verify all objects uploaded
         objects = s3_client.list_objects(bucket_name, prefix='batch/')
         assert len(objects) == batch_size, f"Expected {batch_size} objects, found {len(objects)}"
 
         # Test 2: Batch copy
-        print(f"Batch copying {batch_size} objects...")
+        logger.info(f"Batch copying {batch_size} objects...")
         start_time = time.time()
 
         def copy_object(obj):
@@ -77,7 +79,7 @@ def test_19(s3_client, config):
 
         copy_time = time.time() - start_time
         successful_copies = sum(results)
-        print(f"Batch copy completed: {successful_copies}/{batch_size} objects in {copy_time:.2f}s")
+        logger.info(f"Batch copy completed: {successful_copies}/{batch_size} objects in {copy_time:.2f}s")
 
         # Verify copies
         copied_objects = s3_client.list_objects(bucket_name_2, prefix='copied/')
@@ -85,7 +87,7 @@ def test_19(s3_client, config):
             f"Expected {batch_size} copied objects, found {len(copied_objects)}"
 
         # Test 3: Batch tagging
-        print(f"Batch tagging {batch_size} objects...")
+        logger.info(f"Batch tagging {batch_size} objects...")
         start_time = time.time()
 
         tag_set = {
@@ -109,7 +111,7 @@ def test_19(s3_client, config):
                 pass
 
         tagging_time = time.time() - start_time
-        print(f"Batch tagging completed: {tagged_count}/{batch_size} objects in {tagging_time:.2f}s")
+        logger.info(f"Batch tagging completed: {tagged_count}/{batch_size} objects in {tagging_time:.2f}s")
 
         # Verify tags on a sample object
         if tagged_count > 0:
@@ -122,7 +124,7 @@ def test_19(s3_client, config):
             assert len(tags) > 0, "Tags not applied"
 
         # Test 4: Batch metadata update
-        print("Batch updating metadata...")
+        logger.info("Batch updating metadata...")
         start_time = time.time()
 
         metadata_updated = 0
@@ -146,13 +148,13 @@ def test_19(s3_client, config):
                 pass
 
         metadata_time = time.time() - start_time
-        print(f"Batch metadata update: {metadata_updated} objects in {metadata_time:.2f}s")
+        logger.info(f"Batch metadata update: {metadata_updated} objects in {metadata_time:.2f}s")
 
         # Test 5: Batch delete with delete markers (if versioning enabled)
         # First check if versioning is enabled
         versioning = s3_client.get_bucket_versioning(bucket_name)
         if versioning.get('Status') == 'Enabled':
-            print("Testing batch delete with versioning...")
+            logger.info("Testing batch delete with versioning...")
 
             # Delete half the objects
             delete_batch = test_objects[:batch_size//2]
@@ -166,12 +168,12 @@ def test_19(s3_client, config):
             )
 
             delete_markers = response.get('DeleteMarkers', [])
-            print(f"Delete markers created: {len(delete_markers)}")
+            logger.info(f"Delete markers created: {len(delete_markers)}")
         else:
-            print("Versioning not enabled, skipping delete marker test")
+            logger.info("Versioning not enabled, skipping delete marker test")
 
         # Test 6: Batch delete using delete_objects API
-        print("Batch deleting objects...")
+        logger.info("Batch deleting objects...")
         start_time = time.time()
 
         # Prepare delete list for bucket_name_2
@@ -192,7 +194,7 @@ def test_19(s3_client, config):
             errors = response.get('Errors', [])
 
             delete_time = time.time() - start_time
-            print(f"Batch delete completed: {len(deleted)} deleted, {len(errors)} errors in {delete_time:.2f}s")
+            logger.info(f"Batch delete completed: {len(deleted)} deleted, {len(errors)} errors in {delete_time:.2f}s")
 
             # Verify deletion
             remaining = s3_client.list_objects(bucket_name_2, prefix='copied/')
@@ -200,22 +202,22 @@ def test_19(s3_client, config):
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Batch delete failed: {error_code}")
+            logger.info(f"Note: Batch delete failed: {error_code}")
 
         # Test 7: Batch operations with filters
-        print("Testing filtered batch operations...")
+        logger.info("Testing filtered batch operations...")
 
         # Create objects with different prefixes
         for i in range(5):
             s3_client.put_object(
                 bucket_name,
                 f'type-a/file-{i}.txt',
-                io.BytesIO(f'Type A file {i}'.encode())
+                f'Type A file {i}'.encode()
             )
             s3_client.put_object(
                 bucket_name,
                 f'type-b/file-{i}.txt',
-                io.BytesIO(f'Type B file {i}'.encode())
+                f'Type B file {i}'.encode()
             )
 
         # Batch operation only on type-a objects
@@ -238,10 +240,10 @@ def test_19(s3_client, config):
             except ClientError:
                 pass
 
-        print(f"Filtered batch operation: {operation_count} type-a objects tagged")
+        logger.info(f"Filtered batch operation: {operation_count} type-a objects tagged")
 
         # Test 8: Concurrent batch operations
-        print("Testing concurrent batch operations...")
+        logger.info("Testing concurrent batch operations...")
 
         def concurrent_operation(index):
             """Perform a concurrent operation"""
@@ -250,7 +252,7 @@ def test_19(s3_client, config):
 
             try:
                 # Upload
-                s3_client.put_object(bucket_name, key, io.BytesIO(data))
+                s3_client.put_object(bucket_name, key, data)
 
                 # Tag
                 s3_client.client.put_object_tagging(
@@ -283,10 +285,10 @@ def test_19(s3_client, config):
 
         concurrent_time = time.time() - start_time
         successful = sum(results)
-        print(f"Concurrent operations: {successful}/{concurrent_count} successful in {concurrent_time:.2f}s")
+        logger.info(f"Concurrent operations: {successful}/{concurrent_count} successful in {concurrent_time:.2f}s")
 
         # Test 9: Batch prefix rename (simulate)
-        print("Simulating batch prefix rename...")
+        logger.info("Simulating batch prefix rename...")
 
         # Create objects with old prefix
         old_prefix = 'old-prefix/'
@@ -297,7 +299,7 @@ def test_19(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 key,
-                io.BytesIO(f'File {i} content'.encode())
+                f'File {i} content'.encode()
             )
 
         # "Rename" by copying and deleting
@@ -322,15 +324,15 @@ def test_19(s3_client, config):
             except ClientError:
                 pass
 
-        print(f"Batch rename: {renamed_count} objects renamed from {old_prefix} to {new_prefix}")
+        logger.info(f"Batch rename: {renamed_count} objects renamed from {old_prefix} to {new_prefix}")
 
-        print(f"\nBatch operations test completed:")
-        print(f"- Batch upload: ✓")
-        print(f"- Batch copy: ✓")
-        print(f"- Batch tagging: ✓")
-        print(f"- Batch delete: ✓")
-        print(f"- Concurrent operations: ✓")
-        print(f"- Performance: {batch_size} objects processed efficiently")
+        logger.info(f"Batch operations test completed:")
+        logger.info(f"- Batch upload: ✓")
+        logger.info(f"- Batch copy: ✓")
+        logger.info(f"- Batch tagging: ✓")
+        logger.info(f"- Batch delete: ✓")
+        logger.info(f"- Concurrent operations: ✓")
+        logger.info(f"- Performance: {batch_size} objects processed efficiently")
 
     finally:
         # Cleanup
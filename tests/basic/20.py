@@ -6,10 +6,12 @@ Tests S3 Requester Pays bucket functionality where the requester
 (not the bucket owner) pays for the request and data transfer costs.
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_20(s3_client, config):
     """Request payment test"""
     fixture = TestFixture(s3_client, config)
@@ -28,12 +30,12 @@ def test_20(s3_client, config):
 
             payer = response.get('Payer')
             assert payer == 'BucketOwner', f"Default payer should be BucketOwner, got {payer}"
-            print("Default request payment (BucketOwner): ✓")
+            logger.info("Default request payment (BucketOwner): ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Request payment not supported by this S3 implementation")
+                logger.info("Note: Request payment not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -54,12 +56,12 @@ def test_20(s3_client, config):
 
             payer = response.get('Payer')
             assert payer == 'Requester', f"Payer should be Requester, got {payer}"
-            print("Enable Requester Pays: ✓")
+            logger.info("Enable Requester Pays: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML']:
-                print("Note: Requester Pays configuration not supported")
+                logger.info("Note: Requester Pays configuration not supported")
                 return
             else:
                 raise
@@ -73,11 +75,11 @@ def test_20(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key,
-                Body=io.BytesIO(test_data),
+                Body=test_data,
                 RequestPayer='requester'
             )
 
-            print("Upload to Requester Pays bucket: ✓")
+            logger.info("Upload to Requester Pays bucket: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -87,9 +89,9 @@ def test_20(s3_client, config):
                 s3_client.put_object(
                     bucket_name,
                     object_key,
-                    io.BytesIO(test_data)
+                    test_data
                 )
-                print("Upload to Requester Pays bucket (owner): ✓")
+                logger.info("Upload to Requester Pays bucket (owner): ✓")
             else:
                 raise
 
@@ -99,12 +101,12 @@ def test_20(s3_client, config):
             response = s3_client.get_object(bucket_name, object_key)
 
             # If we get here, the implementation doesn't enforce Requester Pays
-            print("Note: Requester Pays not enforced for downloads")
+            logger.info("Note: Requester Pays not enforced for downloads")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'AccessDenied':
-                print("Access denied without RequestPayer: ✓")
+                logger.info("Access denied without RequestPayer: ✓")
 
                 # Now try with RequestPayer header
                 try:
@@ -116,12 +118,12 @@ def test_20(s3_client, config):
 
                     downloaded_data = response['Body'].read()
                     assert downloaded_data == test_data, "Data mismatch"
-                    print("Download with RequestPayer: ✓")
+                    logger.info("Download with RequestPayer: ✓")
 
                 except ClientError as e2:
-                    print(f"Note: Download with RequestPayer failed: {e2.response['Error']['Code']}")
+                    logger.info(f"Note: Download with RequestPayer failed: {e2.response['Error']['Code']}")
             else:
-                print(f"Note: Unexpected error: {error_code}")
+                logger.info(f"Note: Unexpected error: {error_code}")
 
         # Test 5: List objects in Requester Pays bucket
         try:
@@ -131,7 +133,7 @@ def test_20(s3_client, config):
             )
 
             # If we get here, listing doesn't require RequestPayer
-            print("Note: Listing doesn't require RequestPayer")
+            logger.info("Note: Listing doesn't require RequestPayer")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -145,12 +147,12 @@ def test_20(s3_client, config):
 
                     objects = response.get('Contents', [])
                     assert len(objects) > 0, "No objects found"
-                    print("List with RequestPayer: ✓")
+                    logger.info("List with RequestPayer: ✓")
 
                 except ClientError as e2:
-                    print(f"Note: List with RequestPayer failed: {e2.response['Error']['Code']}")
+                    logger.info(f"Note: List with RequestPayer failed: {e2.response['Error']['Code']}")
             else:
-                print(f"Note: Unexpected list error: {error_code}")
+                logger.info(f"Note: Unexpected list error: {error_code}")
 
         # Test 6: Copy object in Requester Pays bucket
         copy_key = 'copied-requester-pays.txt'
@@ -165,7 +167,7 @@ def test_20(s3_client, config):
                 RequestPayer='requester'
             )
 
-            print("Copy in Requester Pays bucket: ✓")
+            logger.info("Copy in Requester Pays bucket: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -177,11 +179,11 @@ def test_20(s3_client, config):
                         Bucket=bucket_name,
                         Key=copy_key
                     )
-                    print("Copy in Requester Pays bucket (owner): ✓")
+                    logger.info("Copy in Requester Pays bucket (owner): ✓")
                 except ClientError:
-                    print("Note: Copy in Requester Pays bucket not supported")
+                    logger.info("Note: Copy in Requester Pays bucket not supported")
             else:
-                print(f"Note: Copy failed: {error_code}")
+                logger.info(f"Note: Copy failed: {error_code}")
 
         # Test 7: Multipart upload in Requester Pays bucket
         multipart_key = 'multipart-requester-pays.bin'
@@ -204,7 +206,7 @@ def test_20(s3_client, config):
                 Key=multipart_key,
                 UploadId=upload_id,
                 PartNumber=1,
-                Body=io.BytesIO(part_data),
+                Body=part_data,
                 RequestPayer='requester'
             )
 
@@ -218,19 +220,19 @@ def test_20(s3_client, config):
                 RequestPayer='requester'
             )
 
-            print("Multipart upload in Requester Pays bucket: ✓")
+            logger.info("Multipart upload in Requester Pays bucket: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'InvalidArgument']:
-                print("Note: Multipart with RequestPayer not fully supported")
+                logger.info("Note: Multipart with RequestPayer not fully supported")
                 # Try to abort the upload
                 try:
                     s3_client.abort_multipart_upload(bucket_name, multipart_key, upload_id)
                 except:
                     pass
             else:
-                print(f"Note: Multipart failed: {error_code}")
+                logger.info(f"Note: Multipart failed: {error_code}")
 
         # Test 8: HEAD object in Requester Pays bucket
         try:
@@ -238,7 +240,7 @@ def test_20(s3_client, config):
             response = s3_client.head_object(bucket_name, object_key)
 
             # If successful, RequestPayer not enforced for HEAD
-            print("Note: HEAD doesn't require RequestPayer")
+            logger.info("Note: HEAD doesn't require RequestPayer")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -250,11 +252,11 @@ def test_20(s3_client, config):
                         Key=object_key,
                         RequestPayer='requester'
                     )
-                    print("HEAD with RequestPayer: ✓")
+                    logger.info("HEAD with RequestPayer: ✓")
                 except ClientError as e2:
-                    print(f"Note: HEAD with RequestPayer failed: {e2.response['Error']['Code']}")
+                    logger.info(f"Note: HEAD with RequestPayer failed: {e2.response['Error']['Code']}")
             else:
-                print(f"Note: HEAD error: {error_code}")
+                logger.info(f"Note: HEAD error: {error_code}")
 
         # Test 9: Delete object in Requester Pays bucket
         try:
@@ -264,7 +266,7 @@ def test_20(s3_client, config):
                 Key=copy_key,
                 RequestPayer='requester'
             )
-            print("Delete in Requester Pays bucket: ✓")
+            logger.info("Delete in Requester Pays bucket: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -272,11 +274,11 @@ def test_20(s3_client, config):
                 # Try without RequestPayer
                 try:
                     s3_client.delete_object(bucket_name, copy_key)
-                    print("Delete in Requester Pays bucket (owner): ✓")
+                    logger.info("Delete in Requester Pays bucket (owner): ✓")
                 except ClientError:
-                    print("Note: Delete in Requester Pays bucket failed")
+                    logger.info("Note: Delete in Requester Pays bucket failed")
             else:
-                print(f"Note: Delete error: {error_code}")
+                logger.info(f"Note: Delete error: {error_code}")
 
         # Test 10: Disable Requester Pays
         try:
@@ -294,32 +296,32 @@ def test_20(s3_client, config):
 
             payer = response.get('Payer')
             assert payer == 'BucketOwner', f"Payer should be BucketOwner, got {payer}"
-            print("Disable Requester Pays: ✓")
+            logger.info("Disable Requester Pays: ✓")
 
             # Now operations should work without RequestPayer
             response = s3_client.get_object(bucket_name, object_key)
-            print("Access after disabling Requester Pays: ✓")
+            logger.info("Access after disabling Requester Pays: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error disabling Requester Pays: {error_code}")
+            logger.info(f"Note: Error disabling Requester Pays: {error_code}")
 
-        print(f"\nRequest payment test completed:")
-        print(f"- Configuration management: ✓")
-        print(f"- Access control tested")
-        print(f"- Various operations with RequestPayer tested")
+        logger.info(f"Request payment test completed:")
+        logger.info(f"- Configuration management: ✓")
+        logger.info(f"- Access control tested")
+        logger.info(f"- Various operations with RequestPayer tested")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Request payment is not implemented in this S3 provider")
+            logger.info("Request payment is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Make sure Requester Pays is disabled for cleanup
                 try:
@@ -333,9 +335,7 @@ def test_20(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
@@ -6,11 +6,13 @@ Tests S3 static website hosting configuration including index documents,
 error documents, redirection rules, and routing rules.
 """
 
-import io
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_21(s3_client, config):
     """Website configuration test"""
     fixture = TestFixture(s3_client, config)
@@ -47,12 +49,12 @@ def test_21(s3_client, config):
             assert response['ErrorDocument'].get('Key') == 'error.html', \
                 "Error document key mismatch"
 
-            print("Basic website configuration: ✓")
+            logger.info("Basic website configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'MalformedXML', 'InvalidRequest']:
-                print("Note: Website configuration not supported by this S3 implementation")
+                logger.info("Note: Website configuration not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -73,7 +75,7 @@ def test_21(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='index.html',
-            Body=io.BytesIO(index_content),
+            Body=index_content,
             ContentType='text/html'
         )
 
@@ -92,7 +94,7 @@ def test_21(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='error.html',
-            Body=io.BytesIO(error_content),
+            Body=error_content,
             ContentType='text/html'
         )
 
@@ -100,18 +102,18 @@ def test_21(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='about.html',
-            Body=io.BytesIO(b'<html><body><h1>About Page</h1></body></html>'),
+            Body=b'<html><body><h1>About Page</h1></body></html>',
             ContentType='text/html'
         )
 
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='contact.html',
-            Body=io.BytesIO(b'<html><body><h1>Contact Page</h1></body></html>'),
+            Body=b'<html><body><h1>Contact Page</h1></body></html>',
             ContentType='text/html'
         )
 
-        print("Website content created: ✓")
+        logger.info("Website content created: ✓")
 
         # Test 3: Website configuration with redirection rules
         redirect_config = {
@@ -154,14 +156,14 @@ def test_21(s3_client, config):
             if 'RoutingRules' in response:
                 rules = response['RoutingRules']
                 assert len(rules) > 0, "No routing rules found"
-                print(f"Routing rules configured: {len(rules)} rules")
+                logger.info(f"Routing rules configured: {len(rules)} rules")
             else:
-                print("Note: Routing rules may not be supported")
+                logger.info("Note: Routing rules may not be supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Complex routing rules not supported")
+                logger.info("Note: Complex routing rules not supported")
             else:
                 raise
 
@@ -170,18 +172,18 @@ def test_21(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='blog/index.html',
-            Body=io.BytesIO(b'<html><body><h1>Blog Index</h1></body></html>'),
+            Body=b'<html><body><h1>Blog Index</h1></body></html>',
             ContentType='text/html'
         )
 
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='blog/post1.html',
-            Body=io.BytesIO(b'<html><body><h1>Blog Post 1</h1></body></html>'),
+            Body=b'<html><body><h1>Blog Post 1</h1></body></html>',
             ContentType='text/html'
         )
 
-        print("Subdirectory index created: ✓")
+        logger.info("Subdirectory index created: ✓")
 
         # Test 5: Update website configuration
         updated_config = {
@@ -205,7 +207,7 @@ def test_21(s3_client, config):
         assert response['ErrorDocument'].get('Key') == '404.html', \
             "Error document not updated"
 
-        print("Website configuration update: ✓")
+        logger.info("Website configuration update: ✓")
 
         # Test 6: Website with only index document (no error document)
         minimal_config = {
@@ -222,7 +224,7 @@ def test_21(s3_client, config):
         response = s3_client.client.get_bucket_website(Bucket=bucket_name)
         assert 'IndexDocument' in response, "IndexDocument missing"
         # ErrorDocument is optional
-        print("Minimal website configuration: ✓")
+        logger.info("Minimal website configuration: ✓")
 
         # Test 7: Create website assets (CSS, JS, images)
         # Create CSS file
@@ -238,7 +240,7 @@ h1 {
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='styles.css',
-            Body=io.BytesIO(css_content),
+            Body=css_content,
             ContentType='text/css'
         )
 
@@ -247,7 +249,7 @@ h1 {
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='script.js',
-            Body=io.BytesIO(js_content),
+            Body=js_content,
             ContentType='application/javascript'
         )
 
@@ -262,11 +264,11 @@ h1 {
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key='images/logo.png',
-            Body=io.BytesIO(png_data),
+            Body=png_data,
             ContentType='image/png'
         )
 
-        print("Website assets created: ✓")
+        logger.info("Website assets created: ✓")
 
         # Test 8: Website configuration with protocol redirect
         protocol_redirect_config = {
@@ -289,14 +291,14 @@ h1 {
                 redirect = response['RedirectAllRequestsTo']
                 assert redirect.get('HostName') == 'example.com', "HostName mismatch"
                 assert redirect.get('Protocol') == 'https', "Protocol mismatch"
-                print("Redirect all requests configuration: ✓")
+                logger.info("Redirect all requests configuration: ✓")
             else:
-                print("Note: RedirectAllRequestsTo may not be fully supported")
+                logger.info("Note: RedirectAllRequestsTo may not be fully supported")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: RedirectAllRequestsTo not supported")
+                logger.info("Note: RedirectAllRequestsTo not supported")
             else:
                 raise
 
@@ -308,17 +310,17 @@ h1 {
             try:
                 response = s3_client.client.get_bucket_website(Bucket=bucket_name)
                 # If we get here, website config still exists
-                print("Note: Website configuration not fully deleted")
+                logger.info("Note: Website configuration not fully deleted")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'NoSuchWebsiteConfiguration':
-                    print("Website configuration deletion: ✓")
+                    logger.info("Website configuration deletion: ✓")
                 else:
-                    print(f"Note: Unexpected error after deletion: {error_code}")
+                    logger.info(f"Note: Unexpected error after deletion: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error deleting website configuration: {error_code}")
+            logger.info(f"Note: Error deleting website configuration: {error_code}")
 
         # Test 10: Re-enable website configuration for content type test
         s3_client.client.put_bucket_website(
@@ -340,29 +342,29 @@ h1 {
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=filename,
-                Body=io.BytesIO(content),
+                Body=content,
                 ContentType=content_type
             )
 
-        print("Various content types uploaded: ✓")
+        logger.info("Various content types uploaded: ✓")
 
-        print(f"\nWebsite configuration test completed:")
-        print(f"- Basic configuration: ✓")
-        print(f"- Website content: ✓")
-        print(f"- Configuration management: ✓")
-        print(f"- Various asset types: ✓")
+        logger.info(f"Website configuration test completed:")
+        logger.info(f"- Basic configuration: ✓")
+        logger.info(f"- Website content: ✓")
+        logger.info(f"- Configuration management: ✓")
+        logger.info(f"- Various asset types: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Website configuration is not implemented in this S3 provider")
+            logger.info("Website configuration is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Try to delete website configuration first
                 try:
@@ -371,9 +373,7 @@ h1 {
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
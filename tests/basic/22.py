@@ -6,10 +6,12 @@ Tests S3 inventory configuration for generating scheduled reports
 about objects in a bucket.
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_22(s3_client, config):
     """Bucket inventory test"""
     fixture = TestFixture(s3_client, config)
@@ -31,12 +33,12 @@ def test_22(s3_client, config):
 
             configs = response.get('InventoryConfigurationList', [])
             assert len(configs) == 0, "Should have no inventory configurations initially"
-            print("Empty inventory list: ✓")
+            logger.info("Empty inventory list: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Inventory configuration not supported by this S3 implementation")
+                logger.info("Note: Inventory configuration not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -89,12 +91,12 @@ def test_22(s3_client, config):
             assert config.get('Schedule', {}).get('Frequency') == 'Daily', \
                 "Schedule frequency mismatch"
 
-            print("Basic inventory configuration: ✓")
+            logger.info("Basic inventory configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML']:
-                print("Note: Inventory configuration not supported")
+                logger.info("Note: Inventory configuration not supported")
                 return
             else:
                 raise
@@ -134,12 +136,12 @@ def test_22(s3_client, config):
                 InventoryConfiguration=weekly_inventory
             )
 
-            print("Weekly inventory configuration: ✓")
+            logger.info("Weekly inventory configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'MalformedXML']:
-                print("Note: ORC format or weekly schedule may not be supported")
+                logger.info("Note: ORC format or weekly schedule may not be supported")
             else:
                 raise
 
@@ -152,7 +154,7 @@ def test_22(s3_client, config):
         config_ids = [cfg.get('Id') for cfg in configs]
 
         if 'daily-inventory' in config_ids:
-            print(f"Inventory configurations listed: {len(configs)} found")
+            logger.info(f"Inventory configurations listed: {len(configs)} found")
 
         # Test 5: Update inventory configuration
         updated_config = inventory_config.copy()
@@ -176,7 +178,7 @@ def test_22(s3_client, config):
         assert len(config.get('OptionalFields', [])) == 2, \
             "OptionalFields not updated"
 
-        print("Inventory configuration update: ✓")
+        logger.info("Inventory configuration update: ✓")
 
         # Test 6: Inventory with encryption
         encrypted_inventory = {
@@ -206,12 +208,12 @@ def test_22(s3_client, config):
                 InventoryConfiguration=encrypted_inventory
             )
 
-            print("Encrypted inventory configuration: ✓")
+            logger.info("Encrypted inventory configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'NotImplemented']:
-                print("Note: Inventory encryption may not be supported")
+                logger.info("Note: Inventory encryption may not be supported")
             else:
                 raise
 
@@ -228,17 +230,17 @@ def test_22(s3_client, config):
                     Bucket=bucket_name,
                     Id='weekly-inventory'
                 )
-                print("Warning: Inventory configuration not deleted")
+                logger.info("Warning: Inventory configuration not deleted")
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'NoSuchConfiguration':
-                    print("Inventory configuration deletion: ✓")
+                    logger.info("Inventory configuration deletion: ✓")
                 else:
-                    print(f"Note: Unexpected error after deletion: {error_code}")
+                    logger.info(f"Note: Unexpected error after deletion: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error deleting inventory: {error_code}")
+            logger.info(f"Note: Error deleting inventory: {error_code}")
 
         # Test 8: Create objects for inventory
         # Create various objects that would be included in inventory
@@ -254,7 +256,7 @@ def test_22(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(content),
+                Body=content,
                 ContentType=content_type,
                 Metadata={
                     'inventory-test': 'true',
@@ -262,7 +264,7 @@ def test_22(s3_client, config):
                 }
             )
 
-        print(f"Created {len(test_objects)} objects for inventory")
+        logger.info(f"Created {len(test_objects)} objects for inventory")
 
         # Test 9: Inventory with Parquet format
         parquet_inventory = {
@@ -289,12 +291,12 @@ def test_22(s3_client, config):
                 InventoryConfiguration=parquet_inventory
             )
 
-            print("Parquet format inventory: ✓")
+            logger.info("Parquet format inventory: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'MalformedXML']:
-                print("Note: Parquet format may not be supported")
+                logger.info("Note: Parquet format may not be supported")
             else:
                 raise
 
@@ -316,17 +318,17 @@ def test_22(s3_client, config):
             except ClientError:
                 pass
 
-        print(f"Cleaned up {deleted_count} inventory configurations")
+        logger.info(f"Cleaned up {deleted_count} inventory configurations")
 
-        print(f"\nBucket inventory test completed:")
-        print(f"- Configuration management: ✓")
-        print(f"- Multiple formats tested")
-        print(f"- Schedule options tested")
+        logger.info(f"Bucket inventory test completed:")
+        logger.info(f"- Configuration management: ✓")
+        logger.info(f"- Multiple formats tested")
+        logger.info(f"- Schedule options tested")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Bucket inventory is not implemented in this S3 provider")
+            logger.info("Bucket inventory is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
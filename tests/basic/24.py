@@ -6,11 +6,13 @@ Tests S3 Access Points which provide customized access to shared data sets.
 Note: This is primarily an AWS S3 feature and may not be supported by other implementations.
 """
 
-import io
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_24(s3_client, config):
     """Access points test"""
     fixture = TestFixture(s3_client, config)
@@ -45,18 +47,18 @@ def test_24(s3_client, config):
             test_arn = f'arn:aws:s3:{region}:{account_id}:accesspoint/{access_point_name}'
 
             # This is not a standard S3 operation, so we expect it to fail
-            print("Note: Access Points require AWS S3 Control API")
+            logger.info("Note: Access Points require AWS S3 Control API")
 
             # We can test if bucket supports access point policies
             # by checking bucket configuration
             response = s3_client.client.get_bucket_acl(Bucket=bucket_name)
             if response:
-                print("Bucket ACL accessible (access points would extend this)")
+                logger.info("Bucket ACL accessible (access points would extend this)")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'NoSuchAccessPoint', 'InvalidRequest']:
-                print("Note: Access Points not supported by this S3 implementation")
+                logger.info("Note: Access Points not supported by this S3 implementation")
                 return
             else:
                 # Continue with basic bucket operations
@@ -95,12 +97,12 @@ def test_24(s3_client, config):
                 Bucket=bucket_name,
                 Policy=json.dumps(restricted_policy)
             )
-            print("Bucket policy set (simulates access point restrictions): ✓")
+            logger.info("Bucket policy set (simulates access point restrictions): ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'AccessDenied']:
-                print("Note: Bucket policies not supported or access denied")
+                logger.info("Note: Bucket policies not supported or access denied")
             else:
                 pass
 
@@ -116,14 +118,14 @@ def test_24(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(content),
+                Body=content,
                 Metadata={
                     'access-category': category,
                     'test-id': '024'
                 }
             )
 
-        print(f"Created {len(test_objects)} objects for access point simulation")
+        logger.info(f"Created {len(test_objects)} objects for access point simulation")
 
         # Test 4: Simulate VPC-restricted access point
         # In AWS, access points can be restricted to VPC endpoints
@@ -152,9 +154,9 @@ def test_24(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 'vpc-only/restricted.txt',
-                io.BytesIO(b'This would only be accessible from VPC')
+                b'This would only be accessible from VPC'
             )
-            print("VPC-restricted content created: ✓")
+            logger.info("VPC-restricted content created: ✓")
 
         except ClientError:
             pass
@@ -185,15 +187,15 @@ def test_24(s3_client, config):
         s3_client.put_object(
             bucket_name,
             'shared/cross-account.txt',
-            io.BytesIO(b'Shared across accounts via access point')
+            b'Shared across accounts via access point'
         )
-        print("Cross-account shared content created: ✓")
+        logger.info("Cross-account shared content created: ✓")
 
         # Test 6: Test object operations through simulated access point
         # List objects with prefix filter (simulates access point filtering)
         for prefix in ['data/', 'public/', 'private/']:
             objects = s3_client.list_objects(bucket_name, prefix=prefix)
-            print(f"Objects with prefix '{prefix}': {len(objects)}")
+            logger.info(f"Objects with prefix '{prefix}': {len(objects)}")
 
         # Test 7: Block Public Access settings (related to access points)
         try:
@@ -216,45 +218,45 @@ def test_24(s3_client, config):
 
             config = response.get('PublicAccessBlockConfiguration', {})
             if config.get('BlockPublicAcls'):
-                print("Public Access Block configured: ✓")
+                logger.info("Public Access Block configured: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'NoSuchPublicAccessBlockConfiguration']:
-                print("Note: Public Access Block not supported")
+                logger.info("Note: Public Access Block not supported")
             else:
                 pass
 
         # Test 8: Clean up simulated policies
         try:
             s3_client.client.delete_bucket_policy(Bucket=bucket_name)
-            print("Cleanup: Bucket policy removed")
+            logger.info("Cleanup: Bucket policy removed")
         except ClientError:
             pass
 
         try:
             s3_client.client.delete_public_access_block(Bucket=bucket_name)
-            print("Cleanup: Public access block removed")
+            logger.info("Cleanup: Public access block removed")
         except ClientError:
             pass
 
-        print(f"\nAccess points test completed:")
-        print(f"- Access point concepts demonstrated")
-        print(f"- Bucket policies simulated access restrictions")
-        print(f"- Various access patterns tested")
+        logger.info(f"Access points test completed:")
+        logger.info(f"- Access point concepts demonstrated")
+        logger.info(f"- Bucket policies simulated access restrictions")
+        logger.info(f"- Various access patterns tested")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Access Points are not implemented in this S3 provider")
-            print("(This is an AWS-specific feature)")
+            logger.info("Access Points are not implemented in this S3 provider")
+            logger.info("(This is an AWS-specific feature)")
             # This is expected for non-AWS S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Remove any policies
                 try:
@@ -268,9 +270,7 @@ def test_24(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
@@ -6,12 +6,14 @@ Tests S3 Intelligent-Tiering storage class which automatically moves objects
 between access tiers based on changing access patterns.
 """
 
-import io
+import logging
 import time
 from datetime import datetime, timedelta
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_26(s3_client, config):
     """Intelligent tiering test"""
     fixture = TestFixture(s3_client, config)
@@ -30,34 +32,34 @@ def test_26(s3_client, config):
             response = s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=object_key,
-                Body=io.BytesIO(test_data),
+                Body=test_data,
                 StorageClass='INTELLIGENT_TIERING'
             )
 
             # Check if storage class was accepted
             if 'StorageClass' in response:
-                print(f"Upload with INTELLIGENT_TIERING: ✓")
+                logger.info(f"Upload with INTELLIGENT_TIERING: ✓")
             else:
                 # Verify via HEAD
                 response = s3_client.head_object(bucket_name, object_key)
                 storage_class = response.get('StorageClass', 'STANDARD')
 
                 if storage_class == 'INTELLIGENT_TIERING':
-                    print("Object stored in INTELLIGENT_TIERING: ✓")
+                    logger.info("Object stored in INTELLIGENT_TIERING: ✓")
                 else:
-                    print(f"Note: Storage class is {storage_class}, not INTELLIGENT_TIERING")
+                    logger.info(f"Note: Storage class is {storage_class}, not INTELLIGENT_TIERING")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidStorageClass', 'NotImplemented']:
-                print("Note: INTELLIGENT_TIERING storage class not supported")
+                logger.info("Note: INTELLIGENT_TIERING storage class not supported")
                 # Try with STANDARD storage class for remaining tests
                 s3_client.put_object(
                     bucket_name,
                     object_key,
-                    io.BytesIO(test_data)
+                    test_data
                 )
-                print("Using STANDARD storage class for testing")
+                logger.info("Using STANDARD storage class for testing")
             else:
                 raise
 
@@ -68,12 +70,12 @@ def test_26(s3_client, config):
                 Id='test-config'
             )
 
-            print("Intelligent-Tiering configuration exists")
+            logger.info("Intelligent-Tiering configuration exists")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NoSuchConfiguration', 'NotImplemented']:
-                print("No Intelligent-Tiering configuration (expected)")
+                logger.info("No Intelligent-Tiering configuration (expected)")
             else:
                 raise
 
@@ -107,7 +109,7 @@ def test_26(s3_client, config):
                 IntelligentTieringConfiguration=tiering_config
             )
 
-            print("Intelligent-Tiering configuration created: ✓")
+            logger.info("Intelligent-Tiering configuration created: ✓")
 
             # Retrieve and verify
             response = s3_client.client.get_bucket_intelligent_tiering_configuration(
@@ -122,7 +124,7 @@ def test_26(s3_client, config):
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML']:
-                print("Note: Intelligent-Tiering configuration not supported")
+                logger.info("Note: Intelligent-Tiering configuration not supported")
             else:
                 raise
 
@@ -133,12 +135,12 @@ def test_26(s3_client, config):
             )
 
             configs = response.get('IntelligentTieringConfigurationList', [])
-            print(f"Intelligent-Tiering configurations: {len(configs)} found")
+            logger.info(f"Intelligent-Tiering configurations: {len(configs)} found")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Listing Intelligent-Tiering configurations not supported")
+                logger.info("Note: Listing Intelligent-Tiering configurations not supported")
             else:
                 raise
 
@@ -148,7 +150,7 @@ def test_26(s3_client, config):
         s3_client.put_object(
             bucket_name,
             frequently_accessed_key,
-            io.BytesIO(b'Frequently accessed data')
+            b'Frequently accessed data'
         )
 
         # Simulate infrequently accessed object
@@ -156,7 +158,7 @@ def test_26(s3_client, config):
         s3_client.put_object(
             bucket_name,
             infrequent_key,
-            io.BytesIO(b'Rarely accessed data')
+            b'Rarely accessed data'
         )
 
         # Access frequently accessed object multiple times
@@ -165,7 +167,7 @@ def test_26(s3_client, config):
             _ = response['Body'].read()
             time.sleep(0.1)
 
-        print("Created objects with different access patterns: ✓")
+        logger.info("Created objects with different access patterns: ✓")
 
         # Test 6: Check object tier status
         try:
@@ -177,12 +179,12 @@ def test_26(s3_client, config):
             restore_status = response.get('Restore')
 
             if archive_status:
-                print(f"Archive status: {archive_status}")
+                logger.info(f"Archive status: {archive_status}")
 
-            print(f"Current storage class: {storage_class}")
+            logger.info(f"Current storage class: {storage_class}")
 
         except ClientError as e:
-            print(f"Note: Error checking tier status: {e.response['Error']['Code']}")
+            logger.info(f"Note: Error checking tier status: {e.response['Error']['Code']}")
 
         # Test 7: Transition object to INTELLIGENT_TIERING via copy
         try:
@@ -201,14 +203,14 @@ def test_26(s3_client, config):
             storage_class = response.get('StorageClass', 'STANDARD')
 
             if storage_class == 'INTELLIGENT_TIERING':
-                print("Object transitioned to INTELLIGENT_TIERING via copy: ✓")
+                logger.info("Object transitioned to INTELLIGENT_TIERING via copy: ✓")
             else:
-                print(f"Copy resulted in {storage_class} storage class")
+                logger.info(f"Copy resulted in {storage_class} storage class")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'InvalidStorageClass':
-                print("Note: Cannot transition to INTELLIGENT_TIERING via copy")
+                logger.info("Note: Cannot transition to INTELLIGENT_TIERING via copy")
             else:
                 raise
 
@@ -235,12 +237,12 @@ def test_26(s3_client, config):
                 LifecycleConfiguration=lifecycle_config
             )
 
-            print("Lifecycle rule for INTELLIGENT_TIERING created: ✓")
+            logger.info("Lifecycle rule for INTELLIGENT_TIERING created: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidStorageClass', 'MalformedXML', 'InvalidRequest']:
-                print("Note: Lifecycle transition to INTELLIGENT_TIERING not supported")
+                logger.info("Note: Lifecycle transition to INTELLIGENT_TIERING not supported")
             else:
                 raise
 
@@ -249,10 +251,10 @@ def test_26(s3_client, config):
         s3_client.put_object(
             bucket_name,
             auto_tier_key,
-            io.BytesIO(b'Document for automatic tiering')
+            b'Document for automatic tiering'
         )
 
-        print("Object uploaded for automatic tiering: ✓")
+        logger.info("Object uploaded for automatic tiering: ✓")
 
         # Test 10: Delete Intelligent-Tiering configuration
         try:
@@ -261,12 +263,12 @@ def test_26(s3_client, config):
                 Id='archive-old-data'
             )
 
-            print("Intelligent-Tiering configuration deleted: ✓")
+            logger.info("Intelligent-Tiering configuration deleted: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NoSuchConfiguration', 'NotImplemented', 'BucketNotEmpty']:
-                print("Note: No configuration to delete or not supported")
+                logger.info("Note: No configuration to delete or not supported")
             else:
                 raise
 
@@ -291,7 +293,7 @@ def test_26(s3_client, config):
                 multipart_key,
                 upload_id,
                 1,
-                io.BytesIO(part_data)
+                part_data
             )
 
             # Complete multipart upload
@@ -307,12 +309,12 @@ def test_26(s3_client, config):
             response = s3_client.head_object(bucket_name, multipart_key)
             storage_class = response.get('StorageClass', 'STANDARD')
 
-            print(f"Multipart upload storage class: {storage_class}")
+            logger.info(f"Multipart upload storage class: {storage_class}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'InvalidStorageClass':
-                print("Note: INTELLIGENT_TIERING not supported for multipart")
+                logger.info("Note: INTELLIGENT_TIERING not supported for multipart")
             else:
                 # Try to abort if failed
                 try:
@@ -321,22 +323,22 @@ def test_26(s3_client, config):
                     pass
                 raise
 
-        print(f"\nIntelligent tiering test completed:")
-        print(f"- Storage class operations tested")
-        print(f"- Configuration management tested")
-        print(f"- Access pattern simulation: ✓")
+        logger.info(f"Intelligent tiering test completed:")
+        logger.info(f"- Storage class operations tested")
+        logger.info(f"- Configuration management tested")
+        logger.info(f"- Access pattern simulation: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Intelligent-Tiering is not implemented in this S3 provider")
+            logger.info("Intelligent-Tiering is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Delete Intelligent-Tiering configurations
                 try:
@@ -358,9 +360,7 @@ def test_26(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
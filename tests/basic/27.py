@@ -6,11 +6,13 @@ Tests S3 bucket replication functionality including cross-region replication (CR
 and same-region replication (SRR).
 """
 
-import io
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_27(s3_client, config):
     """Replication test"""
     fixture = TestFixture(s3_client, config)
@@ -45,7 +47,7 @@ def test_27(s3_client, config):
         assert source_versioning.get('Status') == 'Enabled', "Source versioning not enabled"
         assert dest_versioning.get('Status') == 'Enabled', "Destination versioning not enabled"
 
-        print("Versioning enabled on both buckets: ✓")
+        logger.info("Versioning enabled on both buckets: ✓")
 
         # Test 2: Get default replication configuration (should not exist)
         try:
@@ -53,14 +55,14 @@ def test_27(s3_client, config):
                 Bucket=source_bucket
             )
 
-            print("Warning: Replication configuration exists by default")
+            logger.info("Warning: Replication configuration exists by default")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'ReplicationConfigurationNotFoundError':
-                print("No default replication configuration: ✓")
+                logger.info("No default replication configuration: ✓")
             elif error_code == 'NotImplemented':
-                print("Note: Replication not supported by this S3 implementation")
+                logger.info("Note: Replication not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -103,7 +105,7 @@ def test_27(s3_client, config):
                 ReplicationConfiguration=replication_config
             )
 
-            print("Basic replication configuration created: ✓")
+            logger.info("Basic replication configuration created: ✓")
 
             # Retrieve and verify
             response = s3_client.client.get_bucket_replication(
@@ -118,7 +120,7 @@ def test_27(s3_client, config):
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML', 'AccessDenied', 'XMinioAdminRemoteArnInvalid']:
-                print("Note: Replication configuration not supported or invalid ARN format")
+                logger.info("Note: Replication configuration not supported or invalid ARN format")
                 return
             else:
                 raise
@@ -134,10 +136,10 @@ def test_27(s3_client, config):
             s3_client.put_object(
                 source_bucket,
                 key,
-                io.BytesIO(content)
+                content
             )
 
-        print(f"Created {len(test_objects)} objects in source bucket")
+        logger.info(f"Created {len(test_objects)} objects in source bucket")
 
         # Test 5: Create replication rule with prefix filter
         filtered_replication = {
@@ -179,12 +181,12 @@ def test_27(s3_client, config):
                 ReplicationConfiguration=filtered_replication
             )
 
-            print("Filtered replication rules created: ✓")
+            logger.info("Filtered replication rules created: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidStorageClass', 'MalformedXML']:
-                print("Note: Some replication features not supported")
+                logger.info("Note: Some replication features not supported")
             else:
                 raise
 
@@ -218,12 +220,12 @@ def test_27(s3_client, config):
                 ReplicationConfiguration=tag_based_replication
             )
 
-            print("Tag-based replication rule created: ✓")
+            logger.info("Tag-based replication rule created: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Tag-based replication not supported")
+                logger.info("Note: Tag-based replication not supported")
             else:
                 raise
 
@@ -232,11 +234,11 @@ def test_27(s3_client, config):
         s3_client.client.put_object(
             Bucket=source_bucket,
             Key=tagged_key,
-            Body=io.BytesIO(b'This should be replicated'),
+            Body=b'This should be replicated',
             Tagging='replicate=yes&priority=high'
         )
 
-        print("Tagged object created for replication: ✓")
+        logger.info("Tagged object created for replication: ✓")
 
         # Test 8: Check replication status
         try:
@@ -245,12 +247,12 @@ def test_27(s3_client, config):
             # Check for replication status header
             replication_status = response.get('ReplicationStatus')
             if replication_status:
-                print(f"Replication status: {replication_status}")
+                logger.info(f"Replication status: {replication_status}")
             else:
-                print("Note: Replication status not available")
+                logger.info("Note: Replication status not available")
 
         except ClientError as e:
-            print(f"Note: Error checking replication status: {e.response['Error']['Code']}")
+            logger.info(f"Note: Error checking replication status: {e.response['Error']['Code']}")
 
         # Test 9: Disable a replication rule
         try:
@@ -272,10 +274,10 @@ def test_27(s3_client, config):
                     ReplicationConfiguration=config
                 )
 
-                print("Replication rule disabled: ✓")
+                logger.info("Replication rule disabled: ✓")
 
         except ClientError as e:
-            print(f"Note: Error disabling rule: {e.response['Error']['Code']}")
+            logger.info(f"Note: Error disabling rule: {e.response['Error']['Code']}")
 
         # Test 10: Cross-account replication configuration
         cross_account_config = {
@@ -308,12 +310,12 @@ def test_27(s3_client, config):
                 ReplicationConfiguration=cross_account_config
             )
 
-            print("Cross-account replication configured: ✓")
+            logger.info("Cross-account replication configured: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidRequest', 'MalformedXML', 'NoSuchBucket']:
-                print("Note: Cross-account replication not testable")
+                logger.info("Note: Cross-account replication not testable")
             else:
                 raise
 
@@ -328,29 +330,29 @@ def test_27(s3_client, config):
                 response = s3_client.client.get_bucket_replication(
                     Bucket=source_bucket
                 )
-                print("Warning: Replication configuration not deleted")
+                logger.info("Warning: Replication configuration not deleted")
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'ReplicationConfigurationNotFoundError':
-                    print("Replication configuration deleted: ✓")
+                    logger.info("Replication configuration deleted: ✓")
                 else:
-                    print(f"Note: Unexpected error: {error_code}")
+                    logger.info(f"Note: Unexpected error: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error deleting replication: {error_code}")
+            logger.info(f"Note: Error deleting replication: {error_code}")
 
-        print(f"\nReplication test completed:")
-        print(f"- Versioning setup: ✓")
-        print(f"- Replication rules tested")
-        print(f"- Various filter types tested")
-        print(f"- Configuration management: ✓")
+        logger.info(f"Replication test completed:")
+        logger.info(f"- Versioning setup: ✓")
+        logger.info(f"- Replication rules tested")
+        logger.info(f"- Various filter types tested")
+        logger.info(f"- Configuration management: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Replication is not implemented in this S3 provider")
+            logger.info("Replication is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
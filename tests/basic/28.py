@@ -5,10 +5,12 @@ Test 28: Metrics configuration
 Tests S3 request metrics configuration for CloudWatch monitoring.
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_28(s3_client, config):
     """Metrics configuration test"""
     fixture = TestFixture(s3_client, config)
@@ -27,12 +29,12 @@ def test_28(s3_client, config):
 
             configs = response.get('MetricsConfigurationList', [])
             assert len(configs) == 0, "Should have no metrics configurations initially"
-            print("Empty metrics configuration list: ✓")
+            logger.info("Empty metrics configuration list: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Metrics configuration not supported by this S3 implementation")
+                logger.info("Note: Metrics configuration not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -59,12 +61,12 @@ def test_28(s3_client, config):
             config = response.get('MetricsConfiguration', {})
             assert config.get('Id') == 'EntireBucket', "Metrics ID mismatch"
 
-            print("Basic metrics configuration created: ✓")
+            logger.info("Basic metrics configuration created: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML']:
-                print("Note: Metrics configuration not supported")
+                logger.info("Note: Metrics configuration not supported")
                 return
             else:
                 raise
@@ -83,7 +85,7 @@ def test_28(s3_client, config):
             MetricsConfiguration=prefix_metrics
         )
 
-        print("Prefix-filtered metrics configuration: ✓")
+        logger.info("Prefix-filtered metrics configuration: ✓")
 
         # Test 4: Create metrics configuration with tag filter
         tag_metrics = {
@@ -103,12 +105,12 @@ def test_28(s3_client, config):
                 MetricsConfiguration=tag_metrics
             )
 
-            print("Tag-filtered metrics configuration: ✓")
+            logger.info("Tag-filtered metrics configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Tag-filtered metrics may not be supported")
+                logger.info("Note: Tag-filtered metrics may not be supported")
             else:
                 raise
 
@@ -139,12 +141,12 @@ def test_28(s3_client, config):
                 MetricsConfiguration=combined_metrics
             )
 
-            print("Combined filter metrics configuration: ✓")
+            logger.info("Combined filter metrics configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Combined filters may not be supported")
+                logger.info("Note: Combined filters may not be supported")
             else:
                 raise
 
@@ -156,11 +158,11 @@ def test_28(s3_client, config):
         configs = response.get('MetricsConfigurationList', [])
         config_ids = [cfg.get('Id') for cfg in configs]
 
-        print(f"Metrics configurations: {len(configs)} found")
+        logger.info(f"Metrics configurations: {len(configs)} found")
         if 'EntireBucket' in config_ids:
-            print("- EntireBucket configuration exists")
+            logger.info("- EntireBucket configuration exists")
         if 'DocumentsMetrics' in config_ids:
-            print("- DocumentsMetrics configuration exists")
+            logger.info("- DocumentsMetrics configuration exists")
 
         # Test 7: Update metrics configuration
         updated_metrics = {
@@ -186,7 +188,7 @@ def test_28(s3_client, config):
         filter_config = config.get('Filter', {})
         assert 'Prefix' in filter_config, "Filter not updated"
 
-        print("Metrics configuration updated: ✓")
+        logger.info("Metrics configuration updated: ✓")
 
         # Test 8: Create objects for metrics tracking
         test_objects = [
@@ -207,13 +209,13 @@ def test_28(s3_client, config):
                 s3_client.client.put_object(
                     Bucket=bucket_name,
                     Key=key,
-                    Body=io.BytesIO(content),
+                    Body=content,
                     Tagging={'TagSet': tag_set}
                 )
             else:
-                s3_client.put_object(bucket_name, key, io.BytesIO(content))
+                s3_client.put_object(bucket_name, key, content)
 
-        print(f"Created {len(test_objects)} objects for metrics tracking")
+        logger.info(f"Created {len(test_objects)} objects for metrics tracking")
 
         # Test 9: Delete specific metrics configuration
         try:
@@ -228,18 +230,18 @@ def test_28(s3_client, config):
                     Bucket=bucket_name,
                     Id='DocumentsMetrics'
                 )
-                print("Warning: Metrics configuration not deleted")
+                logger.info("Warning: Metrics configuration not deleted")
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 if error_code == 'NoSuchConfiguration':
-                    print("Metrics configuration deleted: ✓")
+                    logger.info("Metrics configuration deleted: ✓")
                 else:
-                    print(f"Note: Unexpected error: {error_code}")
+                    logger.info(f"Note: Unexpected error: {error_code}")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            print(f"Note: Error deleting metrics configuration: {error_code}")
+            logger.info(f"Note: Error deleting metrics configuration: {error_code}")
 
         # Test 10: Check if continuation token is supported
         try:
@@ -250,12 +252,12 @@ def test_28(s3_client, config):
             )
 
             if 'NextContinuationToken' in response:
-                print("Pagination supported for metrics configurations")
+                logger.info("Pagination supported for metrics configurations")
             else:
-                print("All metrics configurations returned in single response")
+                logger.info("All metrics configurations returned in single response")
 
         except ClientError as e:
-            print(f"Note: Pagination test error: {e.response['Error']['Code']}")
+            logger.info(f"Note: Pagination test error: {e.response['Error']['Code']}")
 
         # Test 11: Create many metrics configurations (up to limit)
         # S3 allows up to 1000 metrics configurations per bucket
@@ -283,7 +285,7 @@ def test_28(s3_client, config):
         )
 
         final_count = len(response.get('MetricsConfigurationList', []))
-        print(f"Total metrics configurations: {final_count}")
+        logger.info(f"Total metrics configurations: {final_count}")
 
         # Test 12: Clean up all metrics configurations
         configs = response.get('MetricsConfigurationList', [])
@@ -299,24 +301,24 @@ def test_28(s3_client, config):
             except ClientError:
                 pass
 
-        print(f"Cleaned up {deleted_count} metrics configurations")
+        logger.info(f"Cleaned up {deleted_count} metrics configurations")
 
-        print(f"\nMetrics configuration test completed:")
-        print(f"- Configuration management: ✓")
-        print(f"- Various filter types tested")
-        print(f"- CRUD operations: ✓")
+        logger.info(f"Metrics configuration test completed:")
+        logger.info(f"- Configuration management: ✓")
+        logger.info(f"- Various filter types tested")
+        logger.info(f"- CRUD operations: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Metrics configuration is not implemented in this S3 provider")
+            logger.info("Metrics configuration is not implemented in this S3 provider")
             # This is acceptable for some S3 implementations
         else:
             raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Clean up all metrics configurations
                 try:
@@ -332,9 +334,7 @@ def test_28(s3_client, config):
                     pass
 
                 # Delete all objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
@@ -5,10 +5,12 @@ Test 29: Analytics configuration
 Tests S3 Storage Class Analysis configuration for analyzing storage access patterns.
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_29(s3_client, config):
     """Analytics configuration test"""
     fixture = TestFixture(s3_client, config)
@@ -30,12 +32,12 @@ def test_29(s3_client, config):
 
             configs = response.get('AnalyticsConfigurationList', [])
             assert len(configs) == 0, "Should have no analytics configurations initially"
-            print("Empty analytics configuration list: ✓")
+            logger.info("Empty analytics configuration list: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Analytics configuration not supported by this S3 implementation")
+                logger.info("Note: Analytics configuration not supported by this S3 implementation")
                 return
             else:
                 raise
@@ -74,12 +76,12 @@ def test_29(s3_client, config):
             config = response.get('AnalyticsConfiguration', {})
             assert config.get('Id') == 'EntireBucketAnalysis', "Analytics ID mismatch"
 
-            print("Basic analytics configuration created: ✓")
+            logger.info("Basic analytics configuration created: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidRequest', 'MalformedXML']:
-                print("Note: Analytics configuration not supported")
+                logger.info("Note: Analytics configuration not supported")
                 return
             else:
                 raise
@@ -111,7 +113,7 @@ def test_29(s3_client, config):
             AnalyticsConfiguration=prefix_analytics
         )
 
-        print("Prefix-filtered analytics configuration: ✓")
+        logger.info("Prefix-filtered analytics configuration: ✓")
 
         # Test 4: Analytics with tag filter
         tag_analytics = {
@@ -144,12 +146,12 @@ def test_29(s3_client, config):
                 AnalyticsConfiguration=tag_analytics
             )
 
-            print("Tag-filtered analytics configuration: ✓")
+            logger.info("Tag-filtered analytics configuration: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['MalformedXML', 'InvalidRequest']:
-                print("Note: Tag-filtered analytics may not be supported")
+                logger.info("Note: Tag-filtered analytics may not be supported")
 
         # Test 5: List analytics configurations
         response = s3_client.client.list_bucket_analytics_configurations(
@@ -157,7 +159,7 @@ def test_29(s3_client, config):
         )
 
         configs = response.get('AnalyticsConfigurationList', [])
-        print(f"Analytics configurations: {len(configs)} found")
+        logger.info(f"Analytics configurations: {len(configs)} found")
 
         # Test 6: Update analytics configuration
         updated_analytics = {
@@ -183,7 +185,7 @@ def test_29(s3_client, config):
             AnalyticsConfiguration=updated_analytics
         )
 
-        print("Analytics configuration updated: ✓")
+        logger.info("Analytics configuration updated: ✓")
 
         # Test 7: Delete analytics configuration
         s3_client.client.delete_bucket_analytics_configuration(
@@ -191,7 +193,7 @@ def test_29(s3_client, config):
             Id='DocumentsAnalysis'
         )
 
-        print("Analytics configuration deleted: ✓")
+        logger.info("Analytics configuration deleted: ✓")
 
         # Test 8: Clean up remaining configurations
         response = s3_client.client.list_bucket_analytics_configurations(
@@ -204,16 +206,16 @@ def test_29(s3_client, config):
                 Id=config['Id']
             )
 
-        print("All analytics configurations cleaned up: ✓")
+        logger.info("All analytics configurations cleaned up: ✓")
 
-        print(f"\nAnalytics configuration test completed:")
-        print(f"- Configuration management: ✓")
-        print(f"- Filter types tested: ✓")
+        logger.info(f"Analytics configuration test completed:")
+        logger.info(f"- Configuration management: ✓")
+        logger.info(f"- Filter types tested: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'NotImplemented':
-            print("Analytics configuration is not implemented in this S3 provider")
+            logger.info("Analytics configuration is not implemented in this S3 provider")
         else:
             raise
 
@@ -5,10 +5,12 @@ Test 30: Logging configuration
 Tests S3 server access logging configuration.
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_30(s3_client, config):
     """Logging configuration test"""
     fixture = TestFixture(s3_client, config)
@@ -27,14 +29,14 @@ def test_30(s3_client, config):
             response = s3_client.client.get_bucket_logging(Bucket=source_bucket)
 
             if 'LoggingEnabled' in response:
-                print("Warning: Logging enabled by default")
+                logger.info("Warning: Logging enabled by default")
             else:
-                print("Logging disabled by default: ✓")
+                logger.info("Logging disabled by default: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'NotImplemented':
-                print("Note: Logging not supported")
+                logger.info("Note: Logging not supported")
                 return
             else:
                 raise
@@ -57,12 +59,12 @@ def test_30(s3_client, config):
             # Verify
             response = s3_client.client.get_bucket_logging(Bucket=source_bucket)
             assert 'LoggingEnabled' in response, "Logging not enabled"
-            print("Logging enabled: ✓")
+            logger.info("Logging enabled: ✓")
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['NotImplemented', 'InvalidTargetBucketForLogging', 'MalformedXML']:
-                print("Note: Logging configuration not supported")
+                logger.info("Note: Logging configuration not supported")
                 return
             else:
                 raise
@@ -78,7 +80,7 @@ def test_30(s3_client, config):
         response = s3_client.client.get_bucket_logging(Bucket=source_bucket)
         prefix = response.get('LoggingEnabled', {}).get('TargetPrefix')
         assert prefix == 'new-logs/', "Prefix not updated"
-        print("Logging configuration updated: ✓")
+        logger.info("Logging configuration updated: ✓")
 
         # Test 4: Disable logging
         s3_client.client.put_bucket_logging(
@@ -88,9 +90,7 @@ def test_30(s3_client, config):
 
         response = s3_client.client.get_bucket_logging(Bucket=source_bucket)
         assert 'LoggingEnabled' not in response, "Logging not disabled"
-        print("Logging disabled: ✓")
-
-        print(f"\nLogging configuration test completed: ✓")
+        logger.info("Logging disabled: ✓")
 
     finally:
         # Cleanup
@@ -5,10 +5,12 @@ Test 31: Object metadata operations
 Tests setting and retrieving custom object metadata
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_31(s3_client, config):
     """Object metadata operations"""
     fixture = TestFixture(s3_client, config)
@@ -30,7 +32,7 @@ def test_31(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key=key,
-            Body=io.BytesIO(b'Test content'),
+            Body=b'Test content',
             Metadata=metadata
         )
 
@@ -38,22 +40,18 @@ def test_31(s3_client, config):
         response = s3_client.head_object(bucket_name, key)
         retrieved_metadata = response.get('Metadata', {})
         assert 'custom-key1' in retrieved_metadata, "Metadata not found"
-        print("Custom metadata operations: ✓")
-
-        print(f"\nObject metadata operations completed: ✓")
+        logger.info("Custom metadata operations: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        print(f"Error: {error_code}")
+        logger.info(f"Error: {error_code}")
         raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
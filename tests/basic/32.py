@@ -5,10 +5,12 @@ Test 32: Content-Type variations
 Tests various content types for objects
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_32(s3_client, config):
     """Content-Type variations"""
     fixture = TestFixture(s3_client, config)
@@ -33,26 +35,22 @@ def test_32(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(content),
+                Body=content,
                 ContentType=content_type
             )
 
-        print(f"Created {len(content_types)} objects with different content types: ✓")
-
-        print(f"\nContent-Type variations completed: ✓")
+        logger.info(f"Created {len(content_types)} objects with different content types: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        print(f"Error: {error_code}")
+        logger.info(f"Error: {error_code}")
         raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
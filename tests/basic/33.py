@@ -5,10 +5,12 @@ Test 33: Cache-Control headers
 Tests cache control settings for objects
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_33(s3_client, config):
     """Cache-Control headers"""
     fixture = TestFixture(s3_client, config)
@@ -32,7 +34,7 @@ def test_33(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(b'Cached content'),
+                Body=b'Cached content',
                 CacheControl=cache_control
             )
 
@@ -40,22 +42,18 @@ def test_33(s3_client, config):
             response = s3_client.head_object(bucket_name, key)
             assert response.get('CacheControl') == cache_control
 
-        print(f"Cache-Control headers tested: ✓")
-
-        print(f"\nCache-Control headers completed: ✓")
+        logger.info(f"Cache-Control headers tested: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        print(f"Error: {error_code}")
+        logger.info(f"Error: {error_code}")
         raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,10 +5,12 @@ Test 34: Content-Encoding tests
 Tests content encoding like gzip
 """
 
-import io
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_34(s3_client, config):
     """Content-Encoding tests"""
     fixture = TestFixture(s3_client, config)
@@ -31,7 +33,7 @@ def test_34(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key=key,
-            Body=io.BytesIO(compressed),
+            Body=compressed,
             ContentEncoding='gzip',
             ContentType='text/plain'
         )
@@ -39,22 +41,18 @@ def test_34(s3_client, config):
         # Verify encoding
         response = s3_client.head_object(bucket_name, key)
         assert response.get('ContentEncoding') == 'gzip'
-        print("Content-Encoding tested: ✓")
-
-        print(f"\nContent-Encoding tests completed: ✓")
+        logger.info("Content-Encoding tested: ✓")
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        print(f"Error: {error_code}")
+        logger.info(f"Error: {error_code}")
         raise
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
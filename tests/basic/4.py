@@ -7,7 +7,6 @@ Ensures data is not corrupted during upload or download.
 """
 
 import hashlib
-import io
 from common.fixtures import TestFixture
 from common.validators import validate_object_exists
 
@@ -30,7 +29,7 @@ def test_4(s3_client, config):
         response = s3_client.put_object(
             bucket_name,
             object_key,
-            io.BytesIO(test_data),
+            test_data,
             Metadata={'original-md5': original_md5}
         )
 
@@ -55,7 +54,7 @@ def test_4(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 s3_client.delete_object(bucket_name, object_key)
                 s3_client.delete_bucket(bucket_name)
@@ -7,7 +7,6 @@ Validates that large files maintain integrity through S3 operations.
 """
 
 import hashlib
-import io
 import os
 from common.fixtures import TestFixture
 
@@ -55,7 +54,7 @@ def test_5(s3_client, config):
                     object_key,
                     upload_id,
                     part_number,
-                    io.BytesIO(chunk_data)
+                    chunk_data
                 )
 
                 parts.append({
@@ -80,7 +79,7 @@ def test_5(s3_client, config):
             s3_client.put_object(
                 bucket_name,
                 object_key,
-                io.BytesIO(test_data)
+                test_data
             )
 
         original_hash = hasher.hexdigest()
@@ -110,7 +109,7 @@ def test_5(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 s3_client.delete_object(bucket_name, object_key)
                 s3_client.delete_bucket(bucket_name)
@@ -5,12 +5,12 @@ Test 52: Key pattern test
 Tests key name: special!@$%^&()file.txt...
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_52(s3_client, config):
     """Key pattern test"""
     fixture = TestFixture(s3_client, config)
@@ -23,24 +23,16 @@ def test_52(s3_client, config):
         # Test key name: special!@$%^&()file.txt
         data = b'Test content'
         try:
-            s3_client.put_object(bucket_name, 'special!@$%^&()file.txt', io.BytesIO(data))
+            s3_client.put_object(bucket_name, 'special!@$%^&()file.txt', data)
             response = s3_client.get_object(bucket_name, 'special!@$%^&()file.txt')
-            print(f"Key pattern 'special!@$%^&()file.txt' supported: ✓")
+            logger.info(f"Key pattern 'special!@$%^&()file.txt' supported: ✓")
         except ClientError as e:
-            print(f"Key pattern 'special!@$%^&()file.txt' not supported: {e.response['Error']['Code']}")
-
-        print(f"\nTest 52 - Key pattern test: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 52: {e.response['Error']['Code']}")
-        raise
+            logger.info(f"Key pattern 'special!@$%^&()file.txt' not supported: {e.response['Error']['Code']}")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,12 +5,12 @@ Test 57: Content prepend
 Tests content prepend operation
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_57(s3_client, config):
     """Content prepend"""
     fixture = TestFixture(s3_client, config)
@@ -22,7 +22,7 @@ def test_57(s3_client, config):
 
         # Content operation: prepend
         key = 'content-test.txt'
-        s3_client.put_object(bucket_name, key, io.BytesIO(b'Original content'))
+        s3_client.put_object(bucket_name, key, b'Original content')
 
         # Simulate prepend operation
         if 'prepend' == 'copy':
@@ -31,20 +31,12 @@ def test_57(s3_client, config):
                 Bucket=bucket_name,
                 Key=key + '.copy'
             )
-        print(f"Content operation 'prepend': ✓")
-
-        print(f"\nTest 57 - Content prepend: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 57: {e.response['Error']['Code']}")
-        raise
+        logger.info(f"Content operation 'prepend': ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -7,7 +7,6 @@ Ensures S3 handles concurrent operations without data corruption.
 """
 
 import hashlib
-import io
 import threading
 import time
 from common.fixtures import TestFixture
@@ -22,7 +21,7 @@ def upload_object(s3_client, bucket_name, object_key, data, results, index):
         response = s3_client.put_object(
             bucket_name,
             object_key,
-            io.BytesIO(data),
+            data,
             Metadata={'hash': data_hash, 'thread': str(index)}
         )
 
@@ -125,7 +124,7 @@ def test_6(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 for key in uploaded_keys:
                     try:
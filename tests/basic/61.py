@@ -5,12 +5,12 @@ Test 61: Content rename
 Tests content rename operation
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_61(s3_client, config):
     """Content rename"""
     fixture = TestFixture(s3_client, config)
@@ -22,7 +22,7 @@ def test_61(s3_client, config):
 
         # Content operation: rename
         key = 'content-test.txt'
-        s3_client.put_object(bucket_name, key, io.BytesIO(b'Original content'))
+        s3_client.put_object(bucket_name, key, b'Original content')
 
         # Simulate rename operation
         if 'rename' == 'copy':
@@ -31,20 +31,12 @@ def test_61(s3_client, config):
                 Bucket=bucket_name,
                 Key=key + '.copy'
             )
-        print(f"Content operation 'rename': ✓")
-
-        print(f"\nTest 61 - Content rename: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 61: {e.response['Error']['Code']}")
-        raise
+        logger.info(f"Content operation 'rename': ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,12 +5,12 @@ Test 64: Content split
 Tests content split operation
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_64(s3_client, config):
     """Content split"""
     fixture = TestFixture(s3_client, config)
@@ -22,7 +22,7 @@ def test_64(s3_client, config):
 
         # Content operation: split
         key = 'content-test.txt'
-        s3_client.put_object(bucket_name, key, io.BytesIO(b'Original content'))
+        s3_client.put_object(bucket_name, key, b'Original content')
 
         # Simulate split operation
         if 'split' == 'copy':
@@ -31,20 +31,12 @@ def test_64(s3_client, config):
                 Bucket=bucket_name,
                 Key=key + '.copy'
             )
-        print(f"Content operation 'split': ✓")
-
-        print(f"\nTest 64 - Content split: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 64: {e.response['Error']['Code']}")
-        raise
+        logger.info(f"Content operation 'split': ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -7,7 +7,6 @@ Validates that incomplete uploads can be continued from where they left off.
 """
 
 import hashlib
-import io
 import os
 import time
 from common.fixtures import TestFixture
@@ -45,7 +44,7 @@ def test_7(s3_client, config):
                 object_key,
                 upload_id,
                 part_num,
-                io.BytesIO(all_parts_data[part_num - 1])
+                all_parts_data[part_num - 1]
             )
             uploaded_parts.append({
                 'PartNumber': part_num,
@@ -88,7 +87,7 @@ def test_7(s3_client, config):
                 object_key,
                 upload_id,
                 part_num,
-                io.BytesIO(all_parts_data[part_num - 1])
+                all_parts_data[part_num - 1]
             )
             uploaded_parts.append({
                 'PartNumber': part_num,
@@ -135,7 +134,7 @@ def test_7(s3_client, config):
             object_key2,
             upload_id2,
             1,
-            io.BytesIO(all_parts_data[0])
+            all_parts_data[0]
         )
 
         # List uploads and find it
@@ -161,11 +160,9 @@ def test_7(s3_client, config):
             except:
                 pass
 
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
@@ -5,9 +5,6 @@ Test 77: Metadata 2 entries
 Tests object with 2 metadata entries
 """
 
-import io
-import time
-import hashlib
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
@@ -29,7 +26,7 @@ def test_77(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key=key,
-            Body=io.BytesIO(b'Content'),
+            Body=b'Content',
             Metadata=metadata
         )
 
@@ -37,18 +34,10 @@ def test_77(s3_client, config):
         retrieved_meta = response.get('Metadata', {})
         assert len(retrieved_meta) >= 2, "Metadata count mismatch"
 
-        print(f"\nTest 77 - Metadata 2 entries: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 77: {e.response['Error']['Code']}")
-        raise
-
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
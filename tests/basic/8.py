@@ -7,11 +7,12 @@ Ensures data integrity is maintained across different storage tiers.
 """
 
 import hashlib
-import io
-import time
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_8(s3_client, config):
     """Verify checksums across storage tiers test"""
     fixture = TestFixture(s3_client, config)
@@ -66,7 +67,7 @@ def test_8(s3_client, config):
             response = s3_client.put_object(
                 bucket_name,
                 obj['key'],
-                io.BytesIO(obj['data']),
+                obj['data'],
                 StorageClass='STANDARD',
                 Metadata={
                     'original-md5': obj['md5'],
@@ -152,7 +153,7 @@ def test_8(s3_client, config):
             response = s3_client.put_object(
                 bucket_name,
                 obj['key'],
-                io.BytesIO(obj['data']),
+                obj['data'],
                 Metadata={
                     'version': '2',
                     'original-md5': obj['md5']
@@ -197,7 +198,7 @@ def test_8(s3_client, config):
                 if info.get('supported') or info.get('etag'):
                     supported_tiers.add(tier)
 
-        print(f"Supported storage tiers: {sorted(supported_tiers)}")
+        logger.info(f"Supported storage tiers: {sorted(supported_tiers)}")
 
         # At minimum, STANDARD should work with correct checksums
         assert 'STANDARD' in supported_tiers, "STANDARD storage class must be supported"
@@ -210,11 +211,9 @@ def test_8(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
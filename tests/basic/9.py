@@ -6,11 +6,12 @@ Tests S3 object tagging functionality including adding, updating,
 retrieving, and deleting tags on objects.
 """
 
-import io
-import time
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_9(s3_client, config):
     """Object tagging test"""
     fixture = TestFixture(s3_client, config)
@@ -28,7 +29,7 @@ def test_9(s3_client, config):
         response = s3_client.client.put_object(
             Bucket=bucket_name,
             Key=object_key,
-            Body=io.BytesIO(b'Tagged object content'),
+            Body=b'Tagged object content',
             Tagging=tags
         )
 
@@ -83,7 +84,7 @@ def test_9(s3_client, config):
         s3_client.put_object(
             bucket_name,
             special_object_key,
-            io.BytesIO(b'Object with special tags')
+            b'Object with special tags'
         )
 
         special_tags = {
@@ -119,7 +120,7 @@ def test_9(s3_client, config):
         s3_client.put_object(
             bucket_name,
             max_tags_object,
-            io.BytesIO(b'Object with maximum tags')
+            b'Object with maximum tags'
         )
 
         max_tag_set = {
@@ -192,7 +193,7 @@ def test_9(s3_client, config):
         s3_client.client.put_object(
             Bucket=bucket_name,
             Key=source_key,
-            Body=io.BytesIO(b'Source object with tags'),
+            Body=b'Source object with tags',
             Tagging=source_tags
         )
 
@@ -214,10 +215,10 @@ def test_9(s3_client, config):
             # MinIO behavior - tags are copied
             copied_tags = {tag['Key']: tag['Value'] for tag in tag_set}
             assert copied_tags.get('Type') == 'Original', "Original tags not preserved in copy"
-            print("Note: This S3 implementation copies tags by default")
+            logger.info("Note: This S3 implementation copies tags by default")
         else:
             # AWS S3 behavior - tags are not copied
-            print("Note: This S3 implementation does not copy tags by default")
+            logger.info("Note: This S3 implementation does not copy tags by default")
 
         # Now copy with explicit tag specification
         dest_key2 = 'copied-with-new-tags.txt'
@@ -236,10 +237,10 @@ def test_9(s3_client, config):
 
         # Check if tagging worked as expected
         if copied_tags.get('Type') == 'Copy' and copied_tags.get('Priority') == 'Low':
-            print("Copy with explicit tags: ✓")
+            logger.info("Copy with explicit tags: ✓")
         else:
             # Some S3 implementations may not support TaggingDirective
-            print(f"Note: TaggingDirective may not be fully supported (got tags: {copied_tags})")
+            logger.info(f"Note: TaggingDirective may not be fully supported (got tags: {copied_tags})")
 
         # Test 8: Multipart upload with tags
         multipart_key = 'multipart-with-tags.bin'
@@ -261,7 +262,7 @@ def test_9(s3_client, config):
                 multipart_key,
                 upload_id,
                 1,
-                io.BytesIO(part_data)
+                part_data
             )
 
             # Complete multipart upload
@@ -290,22 +291,20 @@ def test_9(s3_client, config):
             s3_client.abort_multipart_upload(bucket_name, multipart_key, upload_id)
             raise e
 
-        print(f"Object tagging test completed:")
-        print(f"- Basic tagging: ✓")
-        print(f"- Tag updates: ✓")
-        print(f"- Special characters: ✓")
-        print(f"- Tag limits: ✓")
-        print(f"- Tag deletion: ✓")
-        print(f"- Copy behavior: ✓")
-        print(f"- Multipart tagging: ✓")
+        logger.info(f"Object tagging test completed:")
+        logger.info(f"- Basic tagging: ✓")
+        logger.info(f"- Tag updates: ✓")
+        logger.info(f"- Special characters: ✓")
+        logger.info(f"- Tag limits: ✓")
+        logger.info(f"- Tag deletion: ✓")
+        logger.info(f"- Copy behavior: ✓")
+        logger.info(f"- Multipart tagging: ✓")
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
@@ -5,13 +5,13 @@ Test 1682: Batch Invoke AWS Lambda function
 Tests S3 Batch Operation: Invoke AWS Lambda function
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1682(s3_client, config):
     """Batch Invoke AWS Lambda function"""
     fixture = TestFixture(s3_client, config)
@@ -26,7 +26,7 @@ def test_1682(s3_client, config):
             # Create objects for batch operation
             for j in range(5):
                 key = f'batch/object-{j}.txt'
-                s3_client.put_object(bucket_name, key, io.BytesIO(f'Batch {j}'.encode()))
+                s3_client.put_object(bucket_name, key, f'Batch {j}'.encode())
 
             # Simulate batch operation (actual batch ops require job creation)
             if 'Invoke AWS Lambda function' == 'Copy':
@@ -38,7 +38,7 @@ def test_1682(s3_client, config):
                         Bucket=bucket_name,
                         Key=obj['Key'].replace('batch/', 'copied/')
                     )
-                print(f"Batch copy operation simulated")
+                logger.info(f"Batch copy operation simulated")
 
             elif 'Invoke AWS Lambda function' == 'Replace all object tags':
                 objects = s3_client.list_objects(bucket_name, prefix='batch/')
@@ -48,33 +48,29 @@ def test_1682(s3_client, config):
                         Key=obj['Key'],
                         Tagging={'TagSet': [{'Key': 'BatchOp', 'Value': str(1682)}]}
                     )
-                print(f"Batch tagging operation simulated")
+                logger.info(f"Batch tagging operation simulated")
 
             else:
-                print(f"Batch operation 'Invoke AWS Lambda function' acknowledged")
+                logger.info(f"Batch operation 'Invoke AWS Lambda function' acknowledged")
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'NotImplemented':
-                print(f"Batch operation 'Invoke AWS Lambda function' not supported")
+                logger.info(f"Batch operation 'Invoke AWS Lambda function' not supported")
             else:
                 raise
 
-        print(f"\nTest 1682 - Batch Invoke AWS Lambda function: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1682 - Feature not supported: {error_code}")
+            logger.info(f"Test 1682 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1682: {error_code}")
+            logger.info(f"Error in test 1682: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -8,6 +8,7 @@ import string
 import io
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,17 @@ logger = logging.getLogger(__name__)
 class TestFixture:
     """Base test fixture with common utilities"""
 
+    __slots__ = (
+        "s3",
+        "config",
+        "bucket_prefix",
+        "created_buckets",
+        "created_objects",
+    )
+
+    # Maximum number of buckets torn down concurrently by cleanup()
+    cleanup_workers = 8
+
     def __init__(self, s3_client, config: Dict[str, Any]):
         """
         Initialize test fixture
@@ -98,6 +110,7 @@ class TestFixture:
 
         self.s3.create_bucket(bucket_name)
         self.created_buckets.append(bucket_name)
+        self.s3.wait_for_bucket(bucket_name)
         logger.debug(f"Created test bucket: {bucket_name}")
         return bucket_name
 
@@ -129,6 +142,17 @@ class TestFixture:
         logger.debug(f"Created test object: {bucket_name}/{key}")
         return key
 
+    def _delete_bucket(self, bucket_name: str):
+        """Empty and delete a single bucket, logging any failure"""
+        try:
+            # Empty the bucket first
+            self.s3.empty_bucket(bucket_name)
+            # Delete the bucket
+            self.s3.delete_bucket(bucket_name)
+            logger.debug(f"Deleted test bucket: {bucket_name}")
+        except Exception as e:
+            logger.warning(f"Failed to delete bucket {bucket_name}: {e}")
+
     def cleanup(self):
         """Clean up all created resources"""
         # Delete all created objects
@@ -139,16 +163,11 @@ class TestFixture:
             except Exception as e:
                 logger.warning(f"Failed to delete object {bucket_name}/{key}: {e}")
 
-        # Empty and delete all created buckets
-        for bucket_name in self.created_buckets:
-            try:
-                # Empty the bucket first
-                self.s3.empty_bucket(bucket_name)
-                # Delete the bucket
-                self.s3.delete_bucket(bucket_name)
-                logger.debug(f"Deleted test bucket: {bucket_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete bucket {bucket_name}: {e}")
+        # Empty and delete all created buckets concurrently
+        if self.created_buckets:
+            workers = min(len(self.created_buckets), self.cleanup_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._delete_bucket, self.created_buckets))
 
         self.created_objects.clear()
         self.created_buckets.clear()
@@ -3,13 +3,29 @@ S3 Client wrapper for test operations
 """
 
 import boto3
+from concurrent.futures import ThreadPoolExecutor
 from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from typing import Optional, Dict, Any, List
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Keys DeleteObjects cannot carry in its XML body: characters outside XML 1.0
+# are rejected outright, and a raw CR is normalized away by the server's parser
+_XML_UNSAFE_KEY = re.compile(r"[^\t\n\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]|\r")
+
+# botocore keeps only 10 pooled connections by default, which the parallel
+# test runner and concurrent teardown exhaust, forcing new TCP/TLS handshakes.
+# TCP keepalive stops idle pooled connections being dropped between tests.
+DEFAULT_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
 
 class S3Client:
     """
@@ -24,6 +40,8 @@ class S3Client:
         region: str = "us-east-1",
         use_ssl: bool = True,
         verify_ssl: bool = True,
+        max_pool_connections: Optional[int] = None,
+        botocore_config: Optional[Config] = None,
     ):
         """
         Initialize S3 client
@@ -35,30 +53,54 @@ class S3Client:
             region: AWS region
             use_ssl: Use SSL/TLS
             verify_ssl: Verify SSL certificates
+            max_pool_connections: Connection pool size, defaults to
+                DEFAULT_CLIENT_CONFIG's; raise it for highly parallel runs
+            botocore_config: Extra botocore Config merged over the defaults
         """
         self.endpoint_url = endpoint_url
         self.region = region
 
+        client_config = DEFAULT_CLIENT_CONFIG
+        if max_pool_connections:
+            client_config = client_config.merge(
+                Config(max_pool_connections=max_pool_connections)
+            )
+        if botocore_config is not None:
+            client_config = client_config.merge(botocore_config)
+
+        self._connection_args = {
+            "endpoint_url": endpoint_url,
+            "aws_access_key_id": access_key,
+            "aws_secret_access_key": secret_key,
+            "region_name": region,
+            "use_ssl": use_ssl,
+            "verify": verify_ssl,
+            "config": client_config,
+        }
+
         # Create boto3 client
-        self.client = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-            use_ssl=use_ssl,
-            verify=verify_ssl,
-        )
+        self.client = boto3.client("s3", **self._connection_args)
 
-        # Create boto3 resource for higher-level operations
-        self.resource = boto3.resource(
-            "s3",
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-            use_ssl=use_ssl,
-            verify=verify_ssl,
+    def with_config(self, botocore_config: Config) -> "S3Client":
+        """
+        Create another S3Client for the same endpoint and credentials
+
+        Args:
+            botocore_config: botocore Config merged over this client's own,
+                e.g. to change the retry policy for a single probe
+
+        Returns:
+            New S3Client with its own boto3 client and connection pool
+        """
+        args = self._connection_args
+        return S3Client(
+            endpoint_url=args["endpoint_url"],
+            access_key=args["aws_access_key_id"],
+            secret_key=args["aws_secret_access_key"],
+            region=args["region_name"],
+            use_ssl=args["use_ssl"],
+            verify_ssl=args["verify"],
+            botocore_config=args["config"].merge(botocore_config),
         )
 
     # Bucket operations
@@ -107,6 +149,34 @@ class S3Client:
                 return False
             raise
 
+    def wait_for_bucket(
+        self,
+        bucket_name: str,
+        exists: bool = True,
+        delay: float = 0.1,
+        max_attempts: int = 50,
+    ):
+        """
+        Block until a bucket exists (or no longer exists)
+
+        Uses the boto3 bucket_exists/bucket_not_exists waiters so callers do
+        not need their own sleep-and-retry loops.
+
+        Args:
+            bucket_name: Bucket name to wait for
+            exists: Wait for the bucket to exist if True, to be gone if False
+            delay: Seconds between HeadBucket polls
+            max_attempts: Maximum number of polls before giving up
+
+        Raises:
+            botocore.exceptions.WaiterError: If the state is not reached
+        """
+        waiter_name = "bucket_exists" if exists else "bucket_not_exists"
+        self.client.get_waiter(waiter_name).wait(
+            Bucket=bucket_name,
+            WaiterConfig={"Delay": delay, "MaxAttempts": max_attempts},
+        )
+
     def get_bucket_location(self, bucket_name: str) -> str:
         """Get bucket location/region"""
         try:
@@ -161,6 +231,53 @@ class S3Client:
             logger.error(f"Error deleting object {bucket_name}/{key}: {e}")
             raise
 
+    def delete_objects(
+        self, bucket_name: str, keys: List[str], max_workers: int = 1, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete objects in batches of up to 1000 keys per request
+
+        Keys that cannot be expressed in the DeleteObjects XML body are
+        deleted one at a time instead. Returns the per-key errors.
+        """
+
+        def delete_single(key: str) -> List[Dict[str, Any]]:
+            try:
+                self.client.delete_object(Bucket=bucket_name, Key=key, **kwargs)
+                return []
+            except ClientError as e:
+                return [{"Key": key, **e.response.get("Error", {})}]
+
+        def delete_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            response = self.client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                **kwargs,
+            )
+            return response.get("Errors", [])
+
+        try:
+            single_keys = [key for key in keys if _XML_UNSAFE_KEY.search(key)]
+            if single_keys:
+                unsafe = set(single_keys)
+                keys = [key for key in keys if key not in unsafe]
+            batches = [keys[i : i + 1000] for i in range(0, len(keys), 1000)]
+            if max_workers > 1 and len(batches) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(delete_batch, batches))
+            else:
+                results = [delete_batch(batch) for batch in batches]
+            results.extend(delete_single(key) for key in single_keys)
+            errors = [error for result in results for error in result]
+            logger.debug(
+                f"Deleted {len(keys) + len(single_keys) - len(errors)} objects: "
+                f"{bucket_name}"
+            )
+            return errors
+        except ClientError as e:
+            logger.error(f"Error deleting objects from {bucket_name}: {e}")
+            raise
+
     def list_objects(
         self, bucket_name: str, prefix: str = "", max_keys: int = 1000, **kwargs
     ) -> List[Dict[str, Any]]:
@@ -476,14 +593,22 @@ class S3Client:
             logger.error(f"Error downloading file: {e}")
             raise
 
-    def empty_bucket(self, bucket_name: str) -> int:
+    def empty_bucket(self, bucket_name: str, max_workers: int = 8) -> int:
         """Delete all objects in a bucket"""
         try:
-            count = 0
-            bucket = self.resource.Bucket(bucket_name)
-            for obj in bucket.objects.all():
-                obj.delete()
-                count += 1
+            paginator = self.client.get_paginator("list_objects_v2")
+            keys = [
+                obj["Key"]
+                for page in paginator.paginate(Bucket=bucket_name)
+                for obj in page.get("Contents", [])
+            ]
+            errors = self.delete_objects(bucket_name, keys, max_workers)
+            for error in errors:
+                logger.warning(
+                    f"Failed to delete {bucket_name}/{error.get('Key')}: "
+                    f"{error.get('Code')}"
+                )
+            count = len(keys) - len(errors)
             logger.debug(f"Deleted {count} objects from {bucket_name}")
             return count
         except ClientError as e:
@@ -8,4 +8,13 @@ import string
 
 def random_string(length=8):
     """Generate a random string of specified length"""
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
\ No newline at end of file
+    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+
+def http_status(error):
+    """HTTP status code of a failed request"""
+    return error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+
+def error_matches(error, codes=(), statuses=()):
+    """Whether a failed request carries one of the expected error codes or HTTP statuses"""
+    return (error.response.get('Error', {}).get('Code') in codes
+            or http_status(error) in statuses)
@@ -9,6 +9,33 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _wait_for(
+    predicate, timeout: float, initial_delay: float = 0.05, max_delay: float = 1.0
+) -> bool:
+    """
+    Poll a predicate with exponential backoff
+
+    Args:
+        predicate: Callable returning True once the condition holds
+        timeout: Maximum time to wait in seconds
+        initial_delay: First delay between polls in seconds
+        max_delay: Upper bound for the delay between polls
+
+    Returns:
+        True if the predicate held before the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
 def validate_bucket_exists(s3_client, bucket_name: str, timeout: int = 30) -> bool:
     """
     Validate that a bucket exists
@@ -24,11 +51,8 @@ def validate_bucket_exists(s3_client, bucket_name: str, timeout: int = 30) -> bo
     Raises:
         AssertionError: If bucket doesn't exist within timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if s3_client.bucket_exists(bucket_name):
-            return True
-        time.sleep(1)
+    if _wait_for(lambda: s3_client.bucket_exists(bucket_name), timeout):
+        return True
 
     raise AssertionError(f"Bucket {bucket_name} does not exist after {timeout} seconds")
 
@@ -51,11 +75,8 @@ def validate_object_exists(
     Raises:
         AssertionError: If object doesn't exist within timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if s3_client.object_exists(bucket_name, key):
-            return True
-        time.sleep(1)
+    if _wait_for(lambda: s3_client.object_exists(bucket_name, key), timeout):
+        return True
 
     raise AssertionError(
         f"Object {bucket_name}/{key} does not exist after {timeout} seconds"
@@ -77,11 +98,8 @@ def validate_bucket_not_exists(s3_client, bucket_name: str, timeout: int = 30) -
     Raises:
         AssertionError: If bucket still exists after timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if not s3_client.bucket_exists(bucket_name):
-            return True
-        time.sleep(1)
+    if _wait_for(lambda: not s3_client.bucket_exists(bucket_name), timeout):
+        return True
 
     raise AssertionError(f"Bucket {bucket_name} still exists after {timeout} seconds")
 
@@ -104,11 +122,8 @@ def validate_object_not_exists(
     Raises:
         AssertionError: If object still exists after timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if not s3_client.object_exists(bucket_name, key):
-            return True
-        time.sleep(1)
+    if _wait_for(lambda: not s3_client.object_exists(bucket_name, key), timeout):
+        return True
 
     raise AssertionError(
         f"Object {bucket_name}/{key} still exists after {timeout} seconds"
@@ -270,6 +285,45 @@ def validate_bucket_versioning(
     return True
 
 
+def validate_version_count(
+    s3_client, bucket_name: str, key: str, min_versions: int, timeout: int = 30
+) -> bool:
+    """
+    Validate that an object has at least a number of versions listed
+
+    Polls with exponential backoff so eventually consistent backends converge
+    as fast as they allow, instead of relying on fixed sleeps.
+
+    Args:
+        s3_client: S3Client instance
+        bucket_name: Versioned bucket containing the object
+        key: Object key to count versions for
+        min_versions: Minimum number of versions expected
+        timeout: Maximum time to wait for the versions to be listed
+
+    Returns:
+        True if enough versions are listed
+
+    Raises:
+        AssertionError: If fewer versions are listed after timeout
+    """
+    counts = []
+
+    def enough_versions():
+        response = s3_client.list_object_versions(bucket_name, Prefix=key)
+        versions = [v for v in response.get("Versions", []) if v["Key"] == key]
+        counts.append(len(versions))
+        return counts[-1] >= min_versions
+
+    if _wait_for(enough_versions, timeout):
+        return True
+
+    raise AssertionError(
+        f"Expected at least {min_versions} versions of {bucket_name}/{key}, "
+        f"found {counts[-1]} after {timeout} seconds"
+    )
+
+
 def validate_object_count(
     s3_client, bucket_name: str, expected_count: int, prefix: str = ""
 ) -> bool:
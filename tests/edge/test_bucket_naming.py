@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
+from botocore.exceptions import ClientError
 
 def test_bucket_naming(s3_client: S3Client):
     """Test bucket naming rules and edge cases"""
@@ -129,7 +130,7 @@ def test_bucket_naming(s3_client: S3Client):
     for bucket in created_buckets:
         try:
             s3_client.delete_bucket(bucket)
-        except:
+        except ClientError:
             pass
 
     return len(results['failed']) == 0
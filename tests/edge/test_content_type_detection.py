@@ -10,12 +10,26 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
-import io
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 
 def test_content_type_detection(s3_client: S3Client):
     """Test content-type detection and handling"""
     bucket_name = f's3-content-type-{random_string(8).lower()}'
 
+    def put_and_head(key, **put_args):
+        """Upload an object and return (head response, error)"""
+        try:
+            s3_client.client.put_object(Bucket=bucket_name, Key=key, **put_args)
+            return s3_client.client.head_object(Bucket=bucket_name, Key=key), None
+        except Exception as e:
+            return None, e
+
+    def put_and_head_all(cases):
+        """Run put_and_head for (key, put_args) cases concurrently, in order"""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(lambda case: put_and_head(case[0], **case[1]), cases))
+
     try:
         s3_client.create_bucket(bucket_name)
         results = {'passed': [], 'failed': []}
@@ -55,26 +69,22 @@ def test_content_type_detection(s3_client: S3Client):
             ('pdf-file.pdf', 'application/pdf', b'%PDF-1.4'),
         ]
 
-        for key, content_type, data in test_cases:
-            try:
-                s3_client.client.put_object(
-                    Bucket=bucket_name,
-                    Key=key,
-                    Body=data,
-                    ContentType=content_type
-                )
-
-                response = s3_client.client.head_object(Bucket=bucket_name, Key=key)
-                actual_type = response.get('ContentType')
-
-                if actual_type == content_type:
-                    results['passed'].append(f'Explicit {content_type}')
-                    print(f"✓ Explicit: {content_type} preserved")
-                else:
-                    results['failed'].append(f'{content_type}: Got {actual_type}')
+        outcomes = put_and_head_all([
+            (key, {'Body': data, 'ContentType': content_type})
+            for key, content_type, data in test_cases
+        ])
+        for (key, content_type, data), (response, error) in zip(test_cases, outcomes):
+            if error:
+                results['failed'].append(f'{content_type}: {str(error)}')
+                continue
+
+            actual_type = response.get('ContentType')
 
-            except Exception as e:
-                results['failed'].append(f'{content_type}: {str(e)}')
+            if actual_type == content_type:
+                results['passed'].append(f'Explicit {content_type}')
+                print(f"✓ Explicit: {content_type} preserved")
+            else:
+                results['failed'].append(f'{content_type}: Got {actual_type}')
 
         # Test 3: Content-type based on file extension
         print("\nTest 3: Content-type from extension")
@@ -92,35 +102,31 @@ def test_content_type_detection(s3_client: S3Client):
             ('test.unknown', None),  # Unknown extension
         ]
 
-        for filename, expected_type in extension_tests:
-            try:
-                s3_client.client.put_object(
-                    Bucket=bucket_name,
-                    Key=filename,
-                    Body=b'test'
-                    # No explicit content-type
-                )
-
-                response = s3_client.client.head_object(Bucket=bucket_name, Key=filename)
-                detected_type = response.get('ContentType')
-
-                if expected_type is None:
-                    # Unknown extension should get default
-                    if detected_type in ['application/octet-stream', 'binary/octet-stream']:
-                        results['passed'].append(f'Unknown ext: {filename}')
-                        print(f"✓ Unknown extension: {filename} → {detected_type}")
-                    else:
-                        results['passed'].append(f'Ext handled: {filename}')
-                elif expected_type in detected_type or detected_type in expected_type:
-                    results['passed'].append(f'Extension: {filename}')
-                    print(f"✓ Extension: {filename} → {detected_type}")
+        # No explicit content-type
+        outcomes = put_and_head_all([
+            (filename, {'Body': b'test'}) for filename, _ in extension_tests
+        ])
+        for (filename, expected_type), (response, error) in zip(extension_tests, outcomes):
+            if error:
+                results['failed'].append(f'Extension {filename}: {str(error)}')
+                continue
+
+            detected_type = response.get('ContentType')
+
+            if expected_type is None:
+                # Unknown extension should get default
+                if detected_type in ['application/octet-stream', 'binary/octet-stream']:
+                    results['passed'].append(f'Unknown ext: {filename}')
+                    print(f"✓ Unknown extension: {filename} → {detected_type}")
                 else:
-                    # Some S3 implementations might not auto-detect
-                    results['passed'].append(f'No auto-detect: {filename}')
-                    print(f"✓ No auto-detect: {filename} → {detected_type}")
-
-            except Exception as e:
-                results['failed'].append(f'Extension {filename}: {str(e)}')
+                    results['passed'].append(f'Ext handled: {filename}')
+            elif expected_type in detected_type or detected_type in expected_type:
+                results['passed'].append(f'Extension: {filename}')
+                print(f"✓ Extension: {filename} → {detected_type}")
+            else:
+                # Some S3 implementations might not auto-detect
+                results['passed'].append(f'No auto-detect: {filename}')
+                print(f"✓ No auto-detect: {filename} → {detected_type}")
 
         # Test 4: Invalid content-types
         print("\nTest 4: Invalid content-types")
@@ -132,28 +138,20 @@ def test_content_type_detection(s3_client: S3Client):
             ('with-parameters', 'image/jpeg; quality=90'),
         ]
 
-        for key, content_type in invalid_types:
-            try:
-                s3_client.client.put_object(
-                    Bucket=bucket_name,
-                    Key=key,
-                    Body=b'test',
-                    ContentType=content_type
-                )
-
-                response = s3_client.client.head_object(Bucket=bucket_name, Key=key)
-                actual_type = response.get('ContentType')
-
+        outcomes = put_and_head_all([
+            (key, {'Body': b'test', 'ContentType': content_type})
+            for key, content_type in invalid_types
+        ])
+        for (key, content_type), (response, error) in zip(invalid_types, outcomes):
+            if error is None:
                 # Most should be accepted as-is
                 results['passed'].append(f'Invalid type: {content_type[:20]}')
                 print(f"✓ Invalid type accepted: {content_type[:30]}...")
-
-            except Exception as e:
-                if 'InvalidArgument' in str(e):
-                    results['passed'].append(f'Invalid rejected: {content_type[:20]}')
-                    print(f"✓ Invalid type rejected: {content_type[:30]}...")
-                else:
-                    results['failed'].append(f'Invalid {content_type}: {str(e)}')
+            elif isinstance(error, ClientError) and error.response['Error']['Code'] == 'InvalidArgument':
+                results['passed'].append(f'Invalid rejected: {content_type[:20]}')
+                print(f"✓ Invalid type rejected: {content_type[:30]}...")
+            else:
+                results['failed'].append(f'Invalid {content_type}: {str(error)}')
 
         # Test 5: Content-type override on copy
         print("\nTest 5: Content-type override on copy")
@@ -225,7 +223,7 @@ def test_content_type_detection(s3_client: S3Client):
                 Key='multipart-typed',
                 UploadId=upload_id,
                 PartNumber=1,
-                Body=io.BytesIO(part_data)
+                Body=part_data
             )
 
             # Complete upload
@@ -281,12 +279,9 @@ def test_content_type_detection(s3_client: S3Client):
     finally:
         # Cleanup
         try:
-            objects = s3_client.client.list_objects_v2(Bucket=bucket_name)
-            if 'Contents' in objects:
-                for obj in objects['Contents']:
-                    s3_client.client.delete_object(Bucket=bucket_name, Key=obj['Key'])
+            s3_client.empty_bucket(bucket_name)
             s3_client.delete_bucket(bucket_name)
-        except:
+        except ClientError:
             pass
 
 if __name__ == "__main__":
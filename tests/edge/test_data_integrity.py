@@ -10,14 +10,25 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
-import io
+from botocore.exceptions import ClientError
 import hashlib
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 def test_data_integrity(s3_client: S3Client):
     """Test data integrity and checksums"""
     bucket_name = f's3-integrity-{random_string(8).lower()}'
 
+    def download_md5(key):
+        """Stream an object through MD5 and return (size, hexdigest)"""
+        obj = s3_client.client.get_object(Bucket=bucket_name, Key=key)
+        md5 = hashlib.md5()
+        size = 0
+        for chunk in obj['Body'].iter_chunks(chunk_size=1024 * 1024):
+            md5.update(chunk)
+            size += len(chunk)
+        return size, md5.hexdigest()
+
     try:
         s3_client.create_bucket(bucket_name)
         results = {'passed': [], 'failed': []}
@@ -62,9 +73,10 @@ def test_data_integrity(s3_client: S3Client):
         key2 = 'integrity-large'
 
         try:
-            # Generate 10MB of pseudo-random data
-            random.seed(42)  # Reproducible random data
-            large_data = bytes([random.randint(0, 255) for _ in range(10 * 1024 * 1024)])
+            # Generate 10MB of pseudo-random data in one call
+            large_size = 10 * 1024 * 1024
+            rng = random.Random(42)  # Reproducible random data
+            large_data = rng.getrandbits(large_size * 8).to_bytes(large_size, 'little')
 
             # Calculate MD5 for verification
             original_md5 = hashlib.md5(large_data).hexdigest()
@@ -77,16 +89,14 @@ def test_data_integrity(s3_client: S3Client):
             )
 
             # Download
-            obj = s3_client.client.get_object(Bucket=bucket_name, Key=key2)
-            downloaded_data = obj['Body'].read()
+            downloaded_size, downloaded_md5 = download_md5(key2)
 
             # Verify size
-            if len(downloaded_data) == len(large_data):
+            if downloaded_size == len(large_data):
                 results['passed'].append('Large data size integrity')
-                print(f"✓ Large size: {len(downloaded_data)} bytes")
+                print(f"✓ Large size: {downloaded_size} bytes")
 
             # Verify MD5
-            downloaded_md5 = hashlib.md5(downloaded_data).hexdigest()
             if original_md5 == downloaded_md5:
                 results['passed'].append('Large data MD5 integrity')
                 print(f"✓ Large MD5: {original_md5}")
@@ -145,9 +155,12 @@ def test_data_integrity(s3_client: S3Client):
                 part_data = f'Part {i} data: '.encode() + bytes([i] * (part_size - 20))
                 parts_data.append(part_data)
 
-            # Calculate expected final data
-            expected_data = b''.join(parts_data)
-            expected_md5 = hashlib.md5(expected_data).hexdigest()
+            # Calculate expected final size and MD5 without joining the parts
+            expected_size = sum(len(part_data) for part_data in parts_data)
+            expected_md5 = hashlib.md5()
+            for part_data in parts_data:
+                expected_md5.update(part_data)
+            expected_md5 = expected_md5.hexdigest()
 
             # Initiate multipart upload
             upload_id = s3_client.client.create_multipart_upload(
@@ -155,17 +168,21 @@ def test_data_integrity(s3_client: S3Client):
                 Key=key4
             )['UploadId']
 
-            # Upload parts
-            parts = []
-            for i, part_data in enumerate(parts_data, 1):
+            # Upload parts concurrently; map() keeps them in part order
+            def upload_part(part_number, part_data):
                 response = s3_client.client.upload_part(
                     Bucket=bucket_name,
                     Key=key4,
                     UploadId=upload_id,
-                    PartNumber=i,
-                    Body=io.BytesIO(part_data)
+                    PartNumber=part_number,
+                    Body=part_data
                 )
-                parts.append({'PartNumber': i, 'ETag': response['ETag']})
+                return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+            with ThreadPoolExecutor(max_workers=num_parts) as executor:
+                parts = list(executor.map(
+                    upload_part, range(1, num_parts + 1), parts_data
+                ))
 
             # Complete upload
             s3_client.client.complete_multipart_upload(
@@ -176,13 +193,11 @@ def test_data_integrity(s3_client: S3Client):
             )
 
             # Download and verify
-            obj = s3_client.client.get_object(Bucket=bucket_name, Key=key4)
-            final_data = obj['Body'].read()
-            final_md5 = hashlib.md5(final_data).hexdigest()
+            final_size, final_md5 = download_md5(key4)
 
-            if len(final_data) == len(expected_data):
+            if final_size == expected_size:
                 results['passed'].append('Multipart size integrity')
-                print(f"✓ Multipart size: {len(final_data)} bytes")
+                print(f"✓ Multipart size: {final_size} bytes")
 
             if final_md5 == expected_md5:
                 results['passed'].append('Multipart MD5 integrity')
@@ -202,23 +217,23 @@ def test_data_integrity(s3_client: S3Client):
             pattern_data = b'0123456789' * 1000  # 10KB with repeating pattern
             s3_client.client.put_object(Bucket=bucket_name, Key=key5, Body=pattern_data)
 
-            # Test various ranges
-            range_tests = [
-                (0, 9, b'0123456789'),
-                (100, 109, b'0123456789'),
-                (500, 519, b'01234567890123456789'),
-                (9990, 9999, b'0123456789'),
-            ]
+            # Test various ranges; expected bytes come from the source data
+            range_tests = [(0, 9), (100, 109), (500, 519), (9990, 9999)]
 
-            for start, end, expected in range_tests:
+            def get_range(byte_range):
+                start, end = byte_range
                 response = s3_client.client.get_object(
                     Bucket=bucket_name,
                     Key=key5,
                     Range=f'bytes={start}-{end}'
                 )
-                range_data = response['Body'].read()
+                return response['Body'].read()
+
+            with ThreadPoolExecutor(max_workers=len(range_tests)) as executor:
+                range_results = list(executor.map(get_range, range_tests))
 
-                if range_data == expected:
+            for (start, end), range_data in zip(range_tests, range_results):
+                if range_data == pattern_data[start:end + 1]:
                     results['passed'].append(f'Range {start}-{end}')
                 else:
                     results['failed'].append(f'Range {start}-{end}: Data mismatch')
@@ -248,9 +263,7 @@ def test_data_integrity(s3_client: S3Client):
             )
 
             # Verify copy
-            obj = s3_client.client.get_object(Bucket=bucket_name, Key=dest_key)
-            copied_data = obj['Body'].read()
-            copied_md5 = hashlib.md5(copied_data).hexdigest()
+            _, copied_md5 = download_md5(dest_key)
 
             if copied_md5 == source_md5:
                 results['passed'].append('Copy integrity')
@@ -273,9 +286,7 @@ def test_data_integrity(s3_client: S3Client):
             s3_client.client.put_object(Bucket=bucket_name, Key=key7, Body=binary_data)
 
             # Download and verify
-            obj = s3_client.client.get_object(Bucket=bucket_name, Key=key7)
-            downloaded_binary = obj['Body'].read()
-            downloaded_md5 = hashlib.md5(downloaded_binary).hexdigest()
+            _, downloaded_md5 = download_md5(key7)
 
             if downloaded_md5 == binary_md5:
                 results['passed'].append('Binary data integrity')
@@ -293,6 +304,9 @@ def test_data_integrity(s3_client: S3Client):
         try:
             # Create streaming data source
             class ChecksumStream:
+                # Every byte value in order; data repeats with period 256
+                PATTERN = bytes(range(256))
+
                 def __init__(self, size):
                     self.size = size
                     self.position = 0
@@ -304,8 +318,9 @@ def test_data_integrity(s3_client: S3Client):
                     if length <= 0:
                         return b''
 
-                    # Generate predictable data
-                    data = bytes([(self.position + i) % 256 for i in range(length)])
+                    # Generate predictable data by slicing the repeated pattern
+                    start = self.position % 256
+                    data = (self.PATTERN * (length // 256 + 2))[start:start + length]
                     self.checksum.update(data)
                     self.position += length
                     return data
@@ -327,9 +342,7 @@ def test_data_integrity(s3_client: S3Client):
             upload_checksum = stream.get_checksum()
 
             # Download and verify
-            obj = s3_client.client.get_object(Bucket=bucket_name, Key=key8)
-            downloaded_data = obj['Body'].read()
-            download_checksum = hashlib.md5(downloaded_data).hexdigest()
+            _, download_checksum = download_md5(key8)
 
             if upload_checksum == download_checksum:
                 results['passed'].append('Streaming integrity')
@@ -346,18 +359,22 @@ def test_data_integrity(s3_client: S3Client):
         try:
             # Test various object sizes to see ETag format
             sizes = [0, 1, 1024, 1024*1024, 5*1024*1024]
+            etag_chars = set('0123456789abcdefABCDEF-')
 
-            for size in sizes:
-                key = f'etag-format-{size}'
-                data = b'E' * size
+            def put_etag(size):
+                response = s3_client.client.put_object(
+                    Bucket=bucket_name, Key=f'etag-format-{size}', Body=b'E' * size
+                )
+                return response.get('ETag', '')
 
-                response = s3_client.client.put_object(Bucket=bucket_name, Key=key, Body=data)
-                etag = response.get('ETag', '')
+            with ThreadPoolExecutor(max_workers=len(sizes)) as executor:
+                etags = list(executor.map(put_etag, sizes))
 
+            for size, etag in zip(sizes, etags):
                 # ETag should be quoted hex string
                 if etag.startswith('"') and etag.endswith('"'):
                     hex_part = etag.strip('"')
-                    if all(c in '0123456789abcdefABCDEF-' for c in hex_part):
+                    if etag_chars.issuperset(hex_part):
                         results['passed'].append(f'ETag format {size}')
                     else:
                         results['failed'].append(f'ETag format {size}: Invalid hex')
@@ -379,12 +396,9 @@ def test_data_integrity(s3_client: S3Client):
     finally:
         # Cleanup
         try:
-            objects = s3_client.client.list_objects_v2(Bucket=bucket_name)
-            if 'Contents' in objects:
-                for obj in objects['Contents']:
-                    s3_client.client.delete_object(Bucket=bucket_name, Key=obj['Key'])
+            s3_client.empty_bucket(bucket_name)
             s3_client.delete_bucket(bucket_name)
-        except:
+        except ClientError:
             pass
 
 if __name__ == "__main__":
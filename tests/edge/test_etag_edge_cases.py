@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
+from botocore.exceptions import ClientError
 import io
 import hashlib
 
@@ -389,12 +390,9 @@ def test_etag_edge_cases(s3_client: S3Client):
     finally:
         # Cleanup
         try:
-            objects = s3_client.client.list_objects_v2(Bucket=bucket_name)
-            if 'Contents' in objects:
-                for obj in objects['Contents']:
-                    s3_client.client.delete_object(Bucket=bucket_name, Key=obj['Key'])
+            s3_client.empty_bucket(bucket_name)
             s3_client.delete_bucket(bucket_name)
-        except:
+        except ClientError:
             pass
 
 if __name__ == "__main__":
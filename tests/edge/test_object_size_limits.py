@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
+from botocore.exceptions import ClientError
 import io
 
 def test_object_size_limits(s3_client: S3Client):
@@ -345,27 +346,9 @@ def test_object_size_limits(s3_client: S3Client):
         # Cleanup
         try:
             print("\nCleaning up size test objects...")
-            # List and delete in batches to handle many objects
-            continuation_token = None
-
-            while True:
-                params = {'Bucket': bucket_name, 'MaxKeys': 1000}
-                if continuation_token:
-                    params['ContinuationToken'] = continuation_token
-
-                response = s3_client.client.list_objects_v2(**params)
-
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        s3_client.client.delete_object(Bucket=bucket_name, Key=obj['Key'])
-
-                if not response.get('IsTruncated'):
-                    break
-
-                continuation_token = response.get('NextContinuationToken')
-
+            s3_client.empty_bucket(bucket_name)
             s3_client.delete_bucket(bucket_name)
-        except:
+        except ClientError:
             pass
 
 if __name__ == "__main__":
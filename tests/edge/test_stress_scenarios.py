@@ -10,7 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.s3_client import S3Client
 from common.test_utils import random_string
-import io
+from botocore.exceptions import ClientError
 import threading
 import time
 import random
@@ -404,40 +404,10 @@ def test_stress_scenarios(s3_client: S3Client):
         # Cleanup
         try:
             print("\nCleaning up stress test objects...")
-
-            # Delete in batches to avoid overwhelming
-            continuation_token = None
-            batch_size = 1000
-
-            while True:
-                params = {'Bucket': bucket_name, 'MaxKeys': batch_size}
-                if continuation_token:
-                    params['ContinuationToken'] = continuation_token
-
-                try:
-                    response = s3_client.client.list_objects_v2(**params)
-
-                    if 'Contents' in response:
-                        for obj in response['Contents']:
-                            try:
-                                s3_client.client.delete_object(
-                                    Bucket=bucket_name,
-                                    Key=obj['Key']
-                                )
-                            except:
-                                pass  # Continue cleanup even if some deletions fail
-
-                    if not response.get('IsTruncated'):
-                        break
-
-                    continuation_token = response.get('NextContinuationToken')
-
-                except:
-                    break  # Exit cleanup loop on error
-
+            s3_client.empty_bucket(bucket_name)
             s3_client.delete_bucket(bucket_name)
 
-        except:
+        except ClientError:
             pass
 
 if __name__ == "__main__":
@@ -5,12 +5,12 @@ Test 451: Encryption test 451
 Tests encryption scenario 451
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_451(s3_client, config):
     """Encryption test 451"""
     fixture = TestFixture(s3_client, config)
@@ -22,21 +22,13 @@ def test_451(s3_client, config):
 
         # Encryption test 451
         key = f'encrypted-451.txt'
-        s3_client.put_object(bucket_name, key, io.BytesIO(b'Encrypted content'))
-        print(f"Encryption test 451: ✓")
-
-        print(f"\nTest 451 - Encryption test 451: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 451: {e.response['Error']['Code']}")
-        raise
+        s3_client.put_object(bucket_name, key, b'Encrypted content')
+        logger.info(f"Encryption test 451: ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,13 +5,13 @@ Test 1495: Lambda integration 1495
 Tests Lambda function trigger 1495
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1495(s3_client, config):
     """Lambda integration 1495"""
     fixture = TestFixture(s3_client, config)
@@ -47,32 +47,28 @@ def test_1495(s3_client, config):
 
             # Upload object to trigger Lambda
             key = f'images/test-1495.jpg'
-            s3_client.put_object(bucket_name, key, io.BytesIO(b'\xFF\xD8\xFF'))  # JPEG header
+            s3_client.put_object(bucket_name, key, b'\xFF\xD8\xFF')  # JPEG header
 
-            print(f"Lambda trigger 1495 configured")
+            logger.info(f"Lambda trigger 1495 configured")
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'NotImplemented':
-                print("Lambda integration not supported")
+                logger.info("Lambda integration not supported")
             else:
                 raise
 
-        print(f"\nTest 1495 - Lambda integration 1495: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1495 - Feature not supported: {error_code}")
+            logger.info(f"Test 1495 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1495: {error_code}")
+            logger.info(f"Error in test 1495: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,12 +5,12 @@ Test 559: Lifecycle test 559
 Tests lifecycle scenario 559
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_559(s3_client, config):
     """Lifecycle test 559"""
     fixture = TestFixture(s3_client, config)
@@ -22,21 +22,13 @@ def test_559(s3_client, config):
 
         # Lifecycle test 559
         key = f'lifecycle-559.txt'
-        s3_client.put_object(bucket_name, key, io.BytesIO(b'Lifecycle content'))
-        print(f"Lifecycle test 559: ✓")
-
-        print(f"\nTest 559 - Lifecycle test 559: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 559: {e.response['Error']['Code']}")
-        raise
+        s3_client.put_object(bucket_name, key, b'Lifecycle content')
+        logger.info(f"Lifecycle test 559: ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
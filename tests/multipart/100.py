@@ -5,11 +5,13 @@ Test 100: Multipart upload - basic 2-part upload
 Tests multipart upload functionality: uploading file in 2 parts
 """
 
-import io
+import logging
 import os
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_100(s3_client, config):
     """Multipart upload - basic 2-part upload"""
     fixture = TestFixture(s3_client, config)
@@ -28,20 +30,16 @@ def test_100(s3_client, config):
         parts = []
         for i in range(1, 3):
             data = (b'A' if i == 1 else b'B') * part_size
-            response = s3_client.upload_part(bucket_name, key, upload_id, i, io.BytesIO(data))
+            response = s3_client.upload_part(bucket_name, key, upload_id, i, data)
             parts.append({'PartNumber': i, 'ETag': response['ETag']})
 
         s3_client.complete_multipart_upload(bucket_name, key, upload_id, parts)
-        print("2-part multipart upload: ✓")
-
-        print(f"\nMultipart test 100 completed: ✓")
+        logger.info("2-part multipart upload: ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
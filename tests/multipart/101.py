@@ -5,11 +5,13 @@ Test 101: Multipart upload - 10-part upload
 Tests multipart upload functionality: uploading file in 10 parts
 """
 
-import io
+import logging
 import os
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_101(s3_client, config):
     """Multipart upload - 10-part upload"""
     fixture = TestFixture(s3_client, config)
@@ -28,20 +30,16 @@ def test_101(s3_client, config):
         parts = []
         for i in range(1, 11):
             data = bytes([65 + i]) * part_size  # Different byte for each part
-            response = s3_client.upload_part(bucket_name, key, upload_id, i, io.BytesIO(data))
+            response = s3_client.upload_part(bucket_name, key, upload_id, i, data)
             parts.append({'PartNumber': i, 'ETag': response['ETag']})
 
         s3_client.complete_multipart_upload(bucket_name, key, upload_id, parts)
-        print("10-part multipart upload: ✓")
-
-        print(f"\nMultipart test 101 completed: ✓")
+        logger.info("10-part multipart upload: ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
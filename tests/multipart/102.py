@@ -6,7 +6,6 @@ Tests cleanup of incomplete multipart uploads.
 Validates proper resource cleanup and error handling.
 """
 
-import io
 import os
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
@@ -36,7 +35,7 @@ def test_102(s3_client, config):
                 object_key,
                 upload_id,
                 part_num,
-                io.BytesIO(part_data)
+                part_data
             )
             parts_uploaded.append({
                 'PartNumber': part_num,
@@ -62,7 +61,7 @@ def test_102(s3_client, config):
                 object_key,
                 upload_id,
                 3,
-                io.BytesIO(b'test data')
+                b'test data'
             )
             assert False, "Should not be able to upload with aborted ID"
         except ClientError as e:
@@ -85,7 +84,7 @@ def test_102(s3_client, config):
         for key, uid in upload_ids:
             part_data = os.urandom(5 * 1024 * 1024)
             s3_client.upload_part(
-                bucket_name, key, uid, 1, io.BytesIO(part_data)
+                bucket_name, key, uid, 1, part_data
             )
 
         # Abort all uploads
@@ -111,10 +110,10 @@ def test_102(s3_client, config):
         part_data = os.urandom(5 * 1024 * 1024)
 
         part1_response = s3_client.upload_part(
-            bucket_name, key1, upload_id1, 1, io.BytesIO(part_data)
+            bucket_name, key1, upload_id1, 1, part_data
         )
         part2_response = s3_client.upload_part(
-            bucket_name, key2, upload_id2, 1, io.BytesIO(part_data)
+            bucket_name, key2, upload_id2, 1, part_data
         )
 
         # Complete the first
@@ -139,11 +138,9 @@ def test_102(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
\ No newline at end of file
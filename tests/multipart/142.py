@@ -5,12 +5,12 @@ Test 142: Multipart list_parts
 Tests multipart list_parts operation
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_142(s3_client, config):
     """Multipart list_parts"""
     fixture = TestFixture(s3_client, config)
@@ -26,28 +26,20 @@ def test_142(s3_client, config):
 
         if 'list_parts' == 'abort':
             s3_client.abort_multipart_upload(bucket_name, key, upload_id)
-            print("Multipart abort: ✓")
+            logger.info("Multipart abort: ✓")
         elif 'list_parts' == 'list_parts':
             # Upload a part first
-            s3_client.upload_part(bucket_name, key, upload_id, 1, io.BytesIO(b'X' * 5242880))
+            s3_client.upload_part(bucket_name, key, upload_id, 1, b'X' * 5242880)
             response = s3_client.client.list_parts(Bucket=bucket_name, Key=key, UploadId=upload_id)
             s3_client.abort_multipart_upload(bucket_name, key, upload_id)
-            print("List parts: ✓")
+            logger.info("List parts: ✓")
         else:
             s3_client.abort_multipart_upload(bucket_name, key, upload_id)
 
-        print(f"\nTest 142 - Multipart list_parts: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 142: {e.response['Error']['Code']}")
-        raise
-
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
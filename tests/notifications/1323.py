@@ -5,13 +5,13 @@ Test 1323: Notification s3:Replication:*
 Tests s3:Replication:* event notification
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1323(s3_client, config):
     """Notification s3:Replication:*"""
     fixture = TestFixture(s3_client, config)
@@ -48,32 +48,28 @@ def test_1323(s3_client, config):
             # Trigger event
             if 'ObjectCreated' in 's3:Replication:*':
                 key = f'notifications/test-1323.txt'
-                s3_client.put_object(bucket_name, key, io.BytesIO(b'Trigger notification'))
+                s3_client.put_object(bucket_name, key, b'Trigger notification')
 
-            print(f"Notification for 's3:Replication:*' configured")
+            logger.info(f"Notification for 's3:Replication:*' configured")
 
         except ClientError as e:
             if e.response['Error']['Code'] in ['NotImplemented', 'InvalidArgument']:
-                print(f"Notification type 's3:Replication:*' not supported")
+                logger.info(f"Notification type 's3:Replication:*' not supported")
             else:
                 raise
 
-        print(f"\nTest 1323 - Notification s3:Replication:*: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1323 - Feature not supported: {error_code}")
+            logger.info(f"Test 1323 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1323: {error_code}")
+            logger.info(f"Error in test 1323: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,13 +5,13 @@ Test 1948: Object Lambda filtering
 Tests S3 Object Lambda transformation: filtering
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1948(s3_client, config):
     """Object Lambda filtering"""
     fixture = TestFixture(s3_client, config)
@@ -29,7 +29,7 @@ def test_1948(s3_client, config):
             # Upload source object
             source_key = f'lambda-source/object-1948.txt'
             source_data = f'Original data for filtering transformation'.encode()
-            s3_client.put_object(bucket_name, source_key, io.BytesIO(source_data))
+            s3_client.put_object(bucket_name, source_key, source_data)
 
             # Simulate transformation (in real scenario, Lambda would process)
             if 'filtering' == 'compress_data':
@@ -45,32 +45,28 @@ def test_1948(s3_client, config):
 
             # Store transformed result
             result_key = f'lambda-result/object-1948-filtering.txt'
-            s3_client.put_object(bucket_name, result_key, io.BytesIO(transformed))
+            s3_client.put_object(bucket_name, result_key, transformed)
 
-            print(f"Object Lambda transformation 'filtering' tested")
+            logger.info(f"Object Lambda transformation 'filtering' tested")
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'NotImplemented':
-                print("S3 Object Lambda not supported")
+                logger.info("S3 Object Lambda not supported")
             else:
                 raise
 
-        print(f"\nTest 1948 - Object Lambda filtering: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1948 - Feature not supported: {error_code}")
+            logger.info(f"Test 1948 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1948: {error_code}")
+            logger.info(f"Error in test 1948: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -6,12 +6,14 @@ Benchmarks sequential read and write operations.
 Measures throughput and latency for various object sizes.
 """
 
+import logging
 import time
 import os
-import io
 import statistics
 from common.fixtures import TestFixture
 
+logger = logging.getLogger(__name__)
+
 def test_600(s3_client, config):
     """Sequential read/write performance test"""
     fixture = TestFixture(s3_client, config)
@@ -38,7 +40,7 @@ def test_600(s3_client, config):
         # Number of iterations per size
         iterations = 10
 
-        print("\n=== Sequential Performance Test ===")
+        logger.info("=== Sequential Performance Test ===")
 
         for size_name, size_bytes in test_sizes.items():
             write_times = []
@@ -49,7 +51,7 @@ def test_600(s3_client, config):
             # Generate test data once for this size
             test_data = os.urandom(size_bytes)
 
-            print(f"\nTesting {size_name} ({size_bytes / 1024:.1f} KB)...")
+            logger.info(f"Testing {size_name} ({size_bytes / 1024:.1f} KB)...")
 
             # Sequential writes
             for i in range(iterations):
@@ -57,7 +59,7 @@ def test_600(s3_client, config):
 
                 # Write performance
                 start_time = time.time()
-                s3_client.put_object(bucket_name, key, io.BytesIO(test_data))
+                s3_client.put_object(bucket_name, key, test_data)
                 write_time = time.time() - start_time
 
                 write_times.append(write_time)
@@ -97,11 +99,11 @@ def test_600(s3_client, config):
             }
 
             # Print summary for this size
-            print(f"  Write: avg={results['write'][size_name]['avg_latency']:.3f}s, "
+            logger.info(f"  Write: avg={results['write'][size_name]['avg_latency']:.3f}s, "
                   f"p50={results['write'][size_name]['p50_latency']:.3f}s, "
                   f"p95={results['write'][size_name]['p95_latency']:.3f}s, "
                   f"throughput={results['write'][size_name]['avg_throughput_mbps']:.1f} MB/s")
-            print(f"  Read:  avg={results['read'][size_name]['avg_latency']:.3f}s, "
+            logger.info(f"  Read:  avg={results['read'][size_name]['avg_latency']:.3f}s, "
                   f"p50={results['read'][size_name]['p50_latency']:.3f}s, "
                   f"p95={results['read'][size_name]['p95_latency']:.3f}s, "
                   f"throughput={results['read'][size_name]['avg_throughput_mbps']:.1f} MB/s")
@@ -125,11 +127,11 @@ def test_600(s3_client, config):
             'avg_read_latency': statistics.mean(all_read_times) if all_read_times else 0
         }
 
-        print("\n=== Performance Summary ===")
-        print(f"Total operations: {results['summary']['total_operations']}")
-        print(f"Total data transferred: {results['summary']['total_data_transferred_mb']:.1f} MB")
-        print(f"Average write latency: {results['summary']['avg_write_latency']:.3f}s")
-        print(f"Average read latency: {results['summary']['avg_read_latency']:.3f}s")
+        logger.info("=== Performance Summary ===")
+        logger.info(f"Total operations: {results['summary']['total_operations']}")
+        logger.info(f"Total data transferred: {results['summary']['total_data_transferred_mb']:.1f} MB")
+        logger.info(f"Average write latency: {results['summary']['avg_write_latency']:.3f}s")
+        logger.info(f"Average read latency: {results['summary']['avg_read_latency']:.3f}s")
 
         # Performance assertions for production readiness
         # Small objects should have low latency
@@ -146,14 +148,9 @@ def test_600(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    try:
-                        s3_client.delete_object(bucket_name, obj['Key'])
-                    except:
-                        pass
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
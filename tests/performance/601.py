@@ -6,19 +6,21 @@ Benchmarks concurrent read/write operations.
 Measures system behavior under parallel load.
 """
 
+import logging
 import time
 import os
-import io
 import threading
 import statistics
 from common.fixtures import TestFixture
 
+logger = logging.getLogger(__name__)
+
 def concurrent_operation(s3_client, bucket, operation, key, data, results, index):
     """Execute a single operation and track timing"""
     start_time = time.time()
     try:
         if operation == 'write':
-            s3_client.put_object(bucket, key, io.BytesIO(data))
+            s3_client.put_object(bucket, key, data)
         elif operation == 'read':
             response = s3_client.get_object(bucket, key)
             _ = response['Body'].read()
@@ -50,10 +52,10 @@ def test_601(s3_client, config):
         object_size = 100 * 1024  # 100KB objects
         operations_per_level = 50
 
-        print("\n=== Concurrent Operations Performance ===")
+        logger.info("=== Concurrent Operations Performance ===")
 
         for concurrent_count in concurrency_levels:
-            print(f"\nTesting with {concurrent_count} concurrent operations...")
+            logger.info(f"Testing with {concurrent_count} concurrent operations...")
 
             # Prepare test data
             test_data = os.urandom(object_size)
@@ -62,7 +64,7 @@ def test_601(s3_client, config):
             setup_keys = []
             for i in range(operations_per_level):
                 key = f'concurrent-{concurrent_count}-{i}.dat'
-                s3_client.put_object(bucket_name, key, io.BytesIO(test_data))
+                s3_client.put_object(bucket_name, key, test_data)
                 setup_keys.append(key)
 
             # Test concurrent writes
@@ -154,11 +156,11 @@ def test_601(s3_client, config):
 
             # Print results for this concurrency level
             level_results = results['concurrent_levels'][concurrent_count]
-            print(f"  Write: {level_results['write']['ops_per_second']:.1f} ops/s, "
+            logger.info(f"  Write: {level_results['write']['ops_per_second']:.1f} ops/s, "
                   f"p50={level_results['write']['p50_latency']:.3f}s, "
                   f"p95={level_results['write']['p95_latency']:.3f}s, "
                   f"failures={level_results['write']['failed_ops']}")
-            print(f"  Read:  {level_results['read']['ops_per_second']:.1f} ops/s, "
+            logger.info(f"  Read:  {level_results['read']['ops_per_second']:.1f} ops/s, "
                   f"p50={level_results['read']['p50_latency']:.3f}s, "
                   f"p95={level_results['read']['p95_latency']:.3f}s, "
                   f"failures={level_results['read']['failed_ops']}")
@@ -176,10 +178,10 @@ def test_601(s3_client, config):
             'best_read_ops_per_second': best_read_ops[1]['read']['ops_per_second']
         }
 
-        print("\n=== Concurrency Summary ===")
-        print(f"Best write concurrency: {results['summary']['best_write_concurrency']} "
+        logger.info("=== Concurrency Summary ===")
+        logger.info(f"Best write concurrency: {results['summary']['best_write_concurrency']} "
               f"({results['summary']['best_write_ops_per_second']:.1f} ops/s)")
-        print(f"Best read concurrency: {results['summary']['best_read_concurrency']} "
+        logger.info(f"Best read concurrency: {results['summary']['best_read_concurrency']} "
               f"({results['summary']['best_read_ops_per_second']:.1f} ops/s)")
 
         # Performance assertions
@@ -197,15 +199,10 @@ def test_601(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Delete all test objects
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    try:
-                        s3_client.delete_object(bucket_name, obj['Key'])
-                    except:
-                        pass
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
             except:
                 pass
@@ -5,12 +5,12 @@ Test 648: Performance test 648
 Tests performance scenario 648
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_648(s3_client, config):
     """Performance test 648"""
     fixture = TestFixture(s3_client, config)
@@ -25,22 +25,14 @@ def test_648(s3_client, config):
         start = time.time()
         for j in range(10):
             key = f'perf-648-{j}.txt'
-            s3_client.put_object(bucket_name, key, io.BytesIO(b'Performance test'))
+            s3_client.put_object(bucket_name, key, b'Performance test')
         elapsed = time.time() - start
-        print(f"Performance test 648: {elapsed:.2f}s")
-
-        print(f"\nTest 648 - Performance test 648: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 648: {e.response['Error']['Code']}")
-        raise
+        logger.info(f"Performance test 648: {elapsed:.2f}s")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,13 +5,13 @@ Test 1204: Replication replication_metrics
 Tests replication_metrics replication scenario
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1204(s3_client, config):
     """Replication replication_metrics"""
     fixture = TestFixture(s3_client, config)
@@ -41,7 +41,7 @@ def test_1204(s3_client, config):
                     Bucket=bucket_name,
                     ReplicationConfiguration=replication_config
                 )
-                print("Cross-region replication configured")
+                logger.info("Cross-region replication configured")
 
             elif 'replication_metrics' == 'replication_metrics':
                 # Test replication metrics
@@ -52,36 +52,32 @@ def test_1204(s3_client, config):
                     }
                 }
 
-                print("Replication metrics test")
+                logger.info("Replication metrics test")
 
             else:
                 # Generic replication test
                 key = f'replicated-object-1204.txt'
-                s3_client.put_object(bucket_name, key, io.BytesIO(b'Replicated content'))
-                print(f"Replication scenario 'replication_metrics' tested")
+                s3_client.put_object(bucket_name, key, b'Replicated content')
+                logger.info(f"Replication scenario 'replication_metrics' tested")
 
         except ClientError as e:
             if e.response['Error']['Code'] in ['NotImplemented', 'InvalidRequest']:
-                print(f"Replication feature 'replication_metrics' not supported")
+                logger.info(f"Replication feature 'replication_metrics' not supported")
             else:
                 raise
 
-        print(f"\nTest 1204 - Replication replication_metrics: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1204 - Feature not supported: {error_code}")
+            logger.info(f"Test 1204 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1204: {error_code}")
+            logger.info(f"Error in test 1204: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -5,13 +5,13 @@ Test 1701: Intelligent-Tiering 1701
 Tests Intelligent-Tiering configuration 1701
 """
 
-import io
-import time
-import hashlib
 import json
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_1701(s3_client, config):
     """Intelligent-Tiering 1701"""
     fixture = TestFixture(s3_client, config)
@@ -57,35 +57,31 @@ def test_1701(s3_client, config):
             s3_client.client.put_object(
                 Bucket=bucket_name,
                 Key=key,
-                Body=io.BytesIO(b'X' * 1024),
+                Body=b'X' * 1024,
                 StorageClass='INTELLIGENT_TIERING',
                 Tagging='TieringEnabled=true'
             )
 
-            print(f"Intelligent-Tiering config 1701 created")
+            logger.info(f"Intelligent-Tiering config 1701 created")
 
         except ClientError as e:
             if e.response['Error']['Code'] in ['NotImplemented', 'InvalidStorageClass']:
-                print("Intelligent-Tiering not supported")
+                logger.info("Intelligent-Tiering not supported")
             else:
                 raise
 
-        print(f"\nTest 1701 - Intelligent-Tiering 1701: ✓")
-
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code in ['NotImplemented', 'InvalidRequest']:
-            print(f"Test 1701 - Feature not supported: {error_code}")
+            logger.info(f"Test 1701 - Feature not supported: {error_code}")
         else:
-            print(f"Error in test 1701: {error_code}")
+            logger.info(f"Error in test 1701: {error_code}")
             raise
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass
@@ -6,9 +6,8 @@ Tests bucket versioning functionality.
 Validates version lifecycle and retrieval.
 """
 
-import io
-import time
 from common.fixtures import TestFixture
+from common.validators import validate_version_count
 from botocore.exceptions import ClientError
 
 def test_200(s3_client, config):
@@ -47,7 +46,7 @@ def test_200(s3_client, config):
             response = s3_client.put_object(
                 bucket_name,
                 object_key,
-                io.BytesIO(content.encode()),
+                content.encode(),
                 Metadata={'version_num': str(i+1)}
             )
             version_id = response.get('VersionId')
@@ -57,17 +56,12 @@ def test_200(s3_client, config):
                     'content': content,
                     'num': i+1
                 })
-            time.sleep(0.5)  # Ensure different timestamps
 
         # List object versions
         if versions:  # Only if versioning is actually working
-            versions_response = s3_client.list_object_versions(bucket_name)
-            object_versions = versions_response.get('Versions', [])
-
-            # Filter for our object
-            our_versions = [v for v in object_versions if v['Key'] == object_key]
-            assert len(our_versions) >= len(versions), \
-                f"Expected at least {len(versions)} versions, found {len(our_versions)}"
+            validate_version_count(
+                s3_client, bucket_name, object_key, len(versions)
+            )
 
             # Get specific version
             if versions[0]['id']:
@@ -96,7 +90,7 @@ def test_200(s3_client, config):
         response = s3_client.put_object(
             bucket_name,
             object_key,
-            io.BytesIO(final_content.encode())
+            final_content.encode()
         )
 
         # Get object without version ID should return latest
@@ -116,7 +110,7 @@ def test_200(s3_client, config):
 
     finally:
         # Cleanup
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
                 # Delete all versions if versioning was enabled
                 try:
@@ -135,9 +129,7 @@ def test_200(s3_client, config):
                         )
                 except:
                     # Fallback to simple delete
-                    objects = s3_client.list_objects(bucket_name)
-                    for obj in objects:
-                        s3_client.delete_object(bucket_name, obj['Key'])
+                    s3_client.empty_bucket(bucket_name)
 
                 s3_client.delete_bucket(bucket_name)
             except:
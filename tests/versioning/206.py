@@ -5,12 +5,12 @@ Test 206: Versioning copy_version
 Tests versioning scenario: copy_version
 """
 
-import io
-import time
-import hashlib
+import logging
 from common.fixtures import TestFixture
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 def test_206(s3_client, config):
     """Versioning copy_version"""
     fixture = TestFixture(s3_client, config)
@@ -28,25 +28,17 @@ def test_206(s3_client, config):
 
         # Create multiple versions
         for v in range(3):
-            s3_client.put_object(bucket_name, key, io.BytesIO(f'Version {v}'.encode()))
+            s3_client.put_object(bucket_name, key, f'Version {v}'.encode())
 
         # List versions
         response = s3_client.client.list_object_versions(Bucket=bucket_name)
         versions = response.get('Versions', [])
-        print(f"Created {len(versions)} versions: ✓")
-
-        print(f"\nTest 206 - Versioning copy_version: ✓")
-
-    except ClientError as e:
-        print(f"Error in test 206: {e.response['Error']['Code']}")
-        raise
+        logger.info(f"Created {len(versions)} versions: ✓")
 
     finally:
-        if bucket_name and s3_client.bucket_exists(bucket_name):
+        if bucket_name:
             try:
-                objects = s3_client.list_objects(bucket_name)
-                for obj in objects:
-                    s3_client.delete_object(bucket_name, obj['Key'])
+                s3_client.empty_bucket(bucket_name)
                 s3_client.delete_bucket(bucket_name)
-            except:
+            except ClientError:
                 pass